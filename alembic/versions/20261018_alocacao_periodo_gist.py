@@ -0,0 +1,33 @@
+"""Add GiST index on the alocacao date range for overlap queries
+
+Revision ID: 20261018_alocacao_periodo_gist
+Revises: 20261018_worklog_partial_ux
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_alocacao_periodo_gist'
+down_revision = '20261018_worklog_partial_ux'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Índice GiST em daterange(data_inicio_alocacao, data_fim_alocacao, '[]')"""
+
+    op.execute(
+        """
+        CREATE INDEX idx_alocacao_periodo_gist
+        ON alocacao_recurso_projeto
+        USING gist (daterange(data_inicio_alocacao, data_fim_alocacao, '[]'))
+        """
+    )
+
+
+def downgrade():
+    """Remove o índice GiST"""
+
+    op.execute("DROP INDEX IF EXISTS idx_alocacao_periodo_gist")
@@ -0,0 +1,39 @@
+"""Add composite indexes on apontamento for period reports
+
+Revision ID: 20261018_apontamento_idx
+Revises: 20261018_ts_defaults
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_apontamento_idx'
+down_revision = '20261018_ts_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Índices (recurso_id, data_apontamento) e (projeto_id, data_apontamento) cobrindo horas_apontadas"""
+
+    op.create_index(
+        'idx_apontamento_recurso_data', 'apontamento',
+        ['recurso_id', 'data_apontamento'],
+        postgresql_using='btree',
+        postgresql_include=['horas_apontadas'],
+    )
+    op.create_index(
+        'idx_apontamento_projeto_data', 'apontamento',
+        ['projeto_id', 'data_apontamento'],
+        postgresql_using='btree',
+        postgresql_include=['horas_apontadas'],
+    )
+
+
+def downgrade():
+    """Remove os índices compostos"""
+
+    op.drop_index('idx_apontamento_projeto_data', 'apontamento')
+    op.drop_index('idx_apontamento_recurso_data', 'apontamento')
@@ -0,0 +1,29 @@
+"""Drop apontamento single-column indexes covered by composite ones
+
+Revision ID: 20261018_drop_redundant_idx
+Revises: 20261018_alocacao_periodo_gist
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_drop_redundant_idx'
+down_revision = '20261018_alocacao_periodo_gist'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """recurso_id e projeto_id já são a coluna inicial de idx_apontamento_*_data"""
+
+    op.execute("DROP INDEX IF EXISTS ix_apontamento_recurso_id")
+    op.execute("DROP INDEX IF EXISTS ix_apontamento_projeto_id")
+
+
+def downgrade():
+    """Recria os índices simples"""
+
+    op.create_index('ix_apontamento_projeto_id', 'apontamento', ['projeto_id'])
+    op.create_index('ix_apontamento_recurso_id', 'apontamento', ['recurso_id'])
@@ -0,0 +1,32 @@
+"""Add covering (ativo, secao_id) index for the projeto detalhados count
+
+Revision ID: 20261018_projeto_ativo_secao
+Revises: 20261018_projeto_nome_id
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_projeto_ativo_secao'
+down_revision = '20261018_projeto_nome_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Índice (ativo, secao_id) INCLUDE (id): o COUNT filtrado vira index-only scan"""
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projeto_ativo_secao "
+            "ON projeto (ativo, secao_id) INCLUDE (id)"
+        )
+
+
+def downgrade():
+    """Remove o índice (ativo, secao_id)"""
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_projeto_ativo_secao")
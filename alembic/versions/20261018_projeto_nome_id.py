@@ -0,0 +1,29 @@
+"""Add (nome, id) index for the projeto cursor pagination
+
+Revision ID: 20261018_projeto_nome_id
+Revises: 20261018_projeto_trgm
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_projeto_nome_id'
+down_revision = '20261018_projeto_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Índice btree (nome, id) usado pelo ORDER BY e pelo cursor de GET /projetos"""
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projeto_nome_id ON projeto (nome, id)")
+
+
+def downgrade():
+    """Remove o índice (nome, id)"""
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_projeto_nome_id")
@@ -0,0 +1,44 @@
+"""Add pg_trgm GIN indexes for the projeto text search
+
+Revision ID: 20261018_projeto_trgm
+Revises: 20261018_drop_redundant_idx
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_projeto_trgm'
+down_revision = '20261018_drop_redundant_idx'
+branch_labels = None
+depends_on = None
+
+
+# A busca de projetos faz OR de ILIKE '%termo%' nessas colunas; o planner só usa
+# BitmapOr se todas tiverem índice, então as três recebem o índice trigram.
+INDICES = (
+    ('idx_projeto_nome_trgm', 'nome'),
+    ('idx_projeto_codigo_empresa_trgm', 'codigo_empresa'),
+    ('idx_projeto_descricao_trgm', 'descricao'),
+)
+
+
+def upgrade():
+    """CREATE EXTENSION pg_trgm e índices GIN (CONCURRENTLY, fora da transação)"""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for nome_indice, coluna in INDICES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {nome_indice} "
+                f"ON projeto USING gin ({coluna} gin_trgm_ops)"
+            )
+
+
+def downgrade():
+    """Remove os índices trigram (a extensão é mantida)"""
+
+    with op.get_context().autocommit_block():
+        for nome_indice, _ in INDICES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {nome_indice}")
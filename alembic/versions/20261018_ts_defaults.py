@@ -0,0 +1,69 @@
+"""Move data_criacao/data_atualizacao defaults to the database
+
+Revision ID: 20261018_ts_defaults
+Revises: 20250724_jira_hierarchy
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_ts_defaults'
+down_revision = '20250724_jira_hierarchy'
+branch_labels = None
+depends_on = None
+
+
+# Tabelas que possuem data_criacao e data_atualizacao
+TABELAS = (
+    'secao',
+    'equipe',
+    'recurso',
+    'status_projeto',
+    'projeto',
+    'alocacao_recurso_projeto',
+    'horas_disponiveis_rh',
+    'horas_planejadas_alocacao',
+    'apontamento',
+    'usuario',
+    'configuracao',
+)
+
+
+def upgrade():
+    """DEFAULT now() no INSERT e trigger BEFORE UPDATE para data_atualizacao"""
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_set_data_atualizacao() RETURNS trigger AS $$
+        BEGIN
+            NEW.data_atualizacao = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for tabela in TABELAS:
+        op.alter_column(tabela, 'data_criacao', server_default=sa.text('now()'))
+        op.alter_column(tabela, 'data_atualizacao', server_default=sa.text('now()'))
+        op.execute(
+            f"""
+            CREATE TRIGGER set_data_atualizacao
+            BEFORE UPDATE ON {tabela}
+            FOR EACH ROW EXECUTE FUNCTION tg_set_data_atualizacao()
+            """
+        )
+
+
+def downgrade():
+    """Remove os triggers e os defaults do banco"""
+
+    for tabela in TABELAS:
+        op.execute(f"DROP TRIGGER IF EXISTS set_data_atualizacao ON {tabela}")
+        op.alter_column(tabela, 'data_atualizacao', server_default=None)
+        op.alter_column(tabela, 'data_criacao', server_default=None)
+
+    op.execute("DROP FUNCTION IF EXISTS tg_set_data_atualizacao()")
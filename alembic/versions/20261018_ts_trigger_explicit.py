@@ -0,0 +1,47 @@
+"""Keep an explicitly written data_atualizacao in tg_set_data_atualizacao
+
+Revision ID: 20261018_ts_trigger_explicit
+Revises: 20261018_projeto_ativo_secao
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_ts_trigger_explicit'
+down_revision = '20261018_projeto_ativo_secao'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Só carimba now() quando o UPDATE não alterou data_atualizacao (ex.: upsert do Jira)"""
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_set_data_atualizacao() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.data_atualizacao IS NOT DISTINCT FROM OLD.data_atualizacao THEN
+                NEW.data_atualizacao = now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade():
+    """Volta a carimbar now() em todo UPDATE"""
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_set_data_atualizacao() RETURNS trigger AS $$
+        BEGIN
+            NEW.data_atualizacao = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
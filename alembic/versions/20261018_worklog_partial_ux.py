@@ -0,0 +1,38 @@
+"""Replace the jira_worklog_id unique index with a partial one
+
+Revision ID: 20261018_worklog_partial_ux
+Revises: 20261018_apontamento_idx
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261018_worklog_partial_ux'
+down_revision = '20261018_apontamento_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Unicidade de jira_worklog_id apenas para linhas vindas do Jira"""
+
+    # A unicidade antiga pode existir como constraint (unique=True) ou como índice (index=True)
+    op.execute("ALTER TABLE apontamento DROP CONSTRAINT IF EXISTS apontamento_jira_worklog_id_key")
+    op.execute("DROP INDEX IF EXISTS ix_apontamento_jira_worklog_id")
+
+    op.create_index(
+        'ux_apontamento_jira_worklog_id', 'apontamento',
+        ['jira_worklog_id'],
+        unique=True,
+        postgresql_where=sa.text('jira_worklog_id IS NOT NULL'),
+    )
+
+
+def downgrade():
+    """Volta ao índice único sobre a coluna inteira"""
+
+    op.drop_index('ux_apontamento_jira_worklog_id', 'apontamento')
+    op.create_index('ix_apontamento_jira_worklog_id', 'apontamento', ['jira_worklog_id'], unique=True)
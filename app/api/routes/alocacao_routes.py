@@ -3,6 +3,7 @@ from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from app.utils.db_errors import unique_violation_detail
 from datetime import datetime
 import logging
 
@@ -266,7 +267,7 @@ async def update_alocacao(
             return await service.update(alocacao_id, update_data)
         except IntegrityError as ie:
             await db.rollback()
-            raise HTTPException(status_code=400, detail="Já existe outra alocação para este recurso neste projeto com a mesma data de início.")
+            raise HTTPException(status_code=400, detail=unique_violation_detail(ie) or "Dados inválidos para a alocação.")
     
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -144,7 +144,7 @@ async def get_disponibilidade_equipe(
                 SELECT
                     arp.recurso_id,
                     hpa.mes,
-                    SUM(hpa.horas_planejadas) as total_horas_alocadas
+                    CAST(SUM(hpa.horas_planejadas) AS double precision) as total_horas_alocadas
                 FROM horas_planejadas_alocacao hpa
                 JOIN alocacao_recurso_projeto arp ON hpa.alocacao_id = arp.id
                 WHERE arp.recurso_id IN (SELECT recurso_id FROM RECURSOS_EQUIPE)
@@ -419,7 +419,7 @@ async def get_horas_por_secao(
 
         # Query para horas planejadas (apenas alocações em andamento)
         sql_planejado = text("""
-            SELECT p.secao_id, SUM(hp.horas_planejadas) as total
+            SELECT p.secao_id, CAST(SUM(hp.horas_planejadas) AS double precision) as total
             FROM horas_planejadas_alocacao hp
             JOIN alocacao_recurso_projeto arp ON hp.alocacao_id = arp.id
             JOIN projeto p ON arp.projeto_id = p.id
@@ -436,7 +436,7 @@ async def get_horas_por_secao(
 
         # Query para horas apontadas (apenas projetos com alocações em andamento)
         sql_apontado = text("""
-            SELECT p.secao_id, SUM(a.horas_apontadas) as total
+            SELECT p.secao_id, CAST(SUM(a.horas_apontadas) AS double precision) as total
             FROM apontamento a
             JOIN projeto p ON a.projeto_id = p.id
             WHERE EXTRACT(YEAR FROM a.data_apontamento) = :ano 
@@ -641,7 +641,7 @@ async def get_disponibilidade_recurso(
                 COALESCE(a.nome_projeto_pai, p.nome) AS projeto_nome,
                 -- Normalizar nome do projeto (remover underscores, espaços extras, maiúsculas)
                 UPPER(TRIM(REPLACE(COALESCE(a.nome_projeto_pai, p.nome), '_', ''))) AS projeto_nome_normalizado,
-                SUM(a.horas_apontadas) AS horas_apontadas,
+                CAST(SUM(a.horas_apontadas) AS double precision) AS horas_apontadas,
                 -- Informações adicionais para debug
                 COUNT(CASE WHEN a.jira_parent_key IS NOT NULL THEN 1 END) AS subtarefas_count,
                 COUNT(CASE WHEN a.jira_parent_key IS NULL THEN 1 END) AS tarefas_principais_count
@@ -14,7 +14,9 @@ router = APIRouter()
 
 from sqlalchemy.future import select
 from sqlalchemy import or_
+from sqlalchemy.orm import load_only
 from app.db.orm_models import Equipe
+from app.utils.search_utils import contains_pattern
 from app.core.security import get_current_admin_user
 
 @router.get("/autocomplete", response_model=dict)
@@ -27,7 +29,7 @@ async def autocomplete_equipes(
     db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
-    query = select(Equipe).where(Equipe.nome.ilike(f"%{search}%"))
+    query = select(Equipe).options(load_only(Equipe.id, Equipe.nome)).where(Equipe.nome.ilike(contains_pattern(search), escape="/"))
     if apenas_ativos:
         query = query.where(Equipe.ativo == True)
     if secao_id:
@@ -74,7 +76,7 @@ async def get_all_equipes(
     # monta query
     base_query = select(Equipe)
     if nome:
-        base_query = base_query.where(Equipe.nome.ilike(f"%{nome}%"))
+        base_query = base_query.where(Equipe.nome.ilike(contains_pattern(nome), escape="/"))
     if secao_id is not None:
         base_query = base_query.where(Equipe.secao_id == secao_id)
     if apenas_ativos:
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from app.db.session import get_async_db
 from app.db.orm_models import Secao, Equipe, Recurso, AlocacaoRecursoProjeto, Projeto
+from app.utils.search_utils import contains_pattern
 from sqlalchemy.future import select
 import traceback
 
@@ -22,7 +23,7 @@ async def get_filtros_populados(
     if entidade == "secao":
         secoes_query = select(Secao).where(Secao.ativo == True)
         if search:
-            secoes_query = secoes_query.where(Secao.nome.like(f"%{search}%"))
+            secoes_query = secoes_query.where(Secao.nome.like(contains_pattern(search), escape="/"))
         elif secao_id:
             secoes_query = secoes_query.where(Secao.id == secao_id)
         secoes = (await db.execute(secoes_query)).scalars().all()
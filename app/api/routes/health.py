@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends
 
+from app.db.session import async_engine
+
 router = APIRouter(tags=["Health"])
 
 
@@ -20,3 +22,18 @@ async def readiness():
 @router.get("/liveness", include_in_schema=False)
 async def liveness():
     return { "status": "ok" };
+
+@router.get("/db", summary="Status do pool de conexões do banco")
+async def db_pool_status():
+    """
+    Retorna a ocupação do pool de conexões assíncrono, para monitorar esgotamento.
+    Não abre conexão com o banco.
+    """
+    pool = async_engine.pool
+    return {
+        "status": pool.status(),
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
@@ -2,6 +2,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from app.utils.db_errors import unique_violation_detail
 import logging
 from datetime import datetime
 
@@ -67,11 +68,11 @@ async def create_horas_planejadas(
         logger.warning(f"[create_horas_planejadas] Erro de validação: {str(e)}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except IntegrityError as e:
-        logger.error(f"[create_horas_planejadas] Erro de integridade: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Já existe um planejamento para esta alocação, ano e mês"
-        )
+        detail = unique_violation_detail(e)
+        if detail is None:
+            logger.error(f"[create_horas_planejadas] Erro de integridade: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Dados inválidos para o planejamento")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
     except Exception as e:
         logger.error(f"[create_horas_planejadas] Erro inesperado: {str(e)}")
         raise HTTPException(
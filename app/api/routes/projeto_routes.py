@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 import logging
 from starlette import status
 from decimal import Decimal
@@ -24,6 +25,7 @@ from app.db.orm_models import Projeto, equipe_projeto_association, Apontamento,
 from app.core.security import get_current_admin_user
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # DTO para entrada de horas planejadas
 class HorasPlanejadasInputDTO(BaseModel):
@@ -37,6 +39,10 @@ class HorasPlanejadasInputDTO(BaseModel):
 from sqlalchemy.future import select
 from sqlalchemy import delete
 from sqlalchemy import or_, func, select
+from sqlalchemy.orm import load_only
+from sqlalchemy.exc import IntegrityError
+from app.utils.db_errors import unique_violation_detail
+from app.utils.search_utils import contains_pattern
 
 @router.get("/autocomplete", response_model=dict)
 async def autocomplete_projetos(
@@ -48,10 +54,10 @@ async def autocomplete_projetos(
     db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_admin_user)
 ):
-    query = select(Projeto).where(
+    query = select(Projeto).options(load_only(Projeto.id, Projeto.nome)).where(
         or_(
-            Projeto.nome.ilike(f"%{search}%"),
-            Projeto.codigo_empresa.ilike(f"%{search}%")
+            Projeto.nome.ilike(contains_pattern(search), escape="/"),
+            Projeto.codigo_empresa.ilike(contains_pattern(search), escape="/")
         )
     )
     if apenas_ativos:
@@ -72,6 +78,7 @@ async def get_projeto_service(db: AsyncSession = Depends(get_async_db)) -> Proje
     horas_planejadas_repository = PlanejamentoHorasRepository(db)
     recurso_repository = RecursoRepository(db)
     return ProjetoService(
+        db_session=db,
         projeto_repository=projeto_repository,
         status_projeto_repository=status_projeto_repository,
         alocacao_repository=alocacao_repository,
@@ -81,7 +88,6 @@ async def get_projeto_service(db: AsyncSession = Depends(get_async_db)) -> Proje
 
 @router.post("/", response_model=ProjetoDTO, status_code=status.HTTP_201_CREATED)
 async def create_projeto(projeto_create: ProjetoCreateSchema, service: ProjetoService = Depends(get_projeto_service)):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info("[create_projeto] Início")
     try:
         result = await service.create_projeto(projeto_create)
@@ -99,13 +105,11 @@ async def create_projeto(projeto_create: ProjetoCreateSchema, service: ProjetoSe
 @router.post("/com-alocacoes", response_model=ProjetoDTO, status_code=status.HTTP_201_CREATED)
 async def create_projeto_com_alocacoes(
     payload: ProjetoComAlocacoesCreateDTO,
-    service: ProjetoService = Depends(get_projeto_service),
-    db: AsyncSession = Depends(get_async_db)
+    service: ProjetoService = Depends(get_projeto_service)
 ):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info("[create_projeto_com_alocacoes] Início")
     try:
-        novo = await service.create_projeto_com_alocacoes(payload, db)
+        novo = await service.create_projeto_com_alocacoes(payload)
         logger.info("[create_projeto_com_alocacoes] Sucesso")
         return novo
     except HTTPException as e:
@@ -173,18 +177,37 @@ async def get_all_projetos(
     search: Optional[str] = None,
     nome: Optional[str] = Query(None),
     include_inactive: bool = False,  
+    after_nome: Optional[str] = Query(None, description="Cursor: nome do último projeto da página anterior (usar junto com after_id)"),
+    after_id: Optional[int] = Query(None, description="Cursor: id do último projeto da página anterior (usar junto com after_nome)"),
     service: ProjetoService = Depends(get_projeto_service)
 ):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
+    """
+    Lista projetos ordenados por nome.
+
+    Resposta: `{"items": [...], "total": int | null, "next_cursor": {...} | null}`.
+    - Sem cursor, pagina por skip/limit e `total` traz o total filtrado.
+    - Com cursor (`after_nome` e `after_id`, copiados de `next_cursor`), `skip` é ignorado e
+      `total` vem `null`: o total não é recontado a cada página, use o da primeira.
+    """
+    if (after_nome is None) != (after_id is None):
+        # Só metade do cursor cairia na paginação por skip e devolveria a primeira página de novo
+        raise HTTPException(status_code=422, detail="Informe after_nome e after_id juntos (ou nenhum dos dois).")
     logger.info(f"[get_all_projetos] Início - skip={skip}, limit={limit}, status_projeto={status_projeto}, search='{search}'")
     try:
         # Frontend antigo envia parâmetro "nome"; convertemos se "search" não veio.
         if not search and nome:
             search = nome
-        items = await service.get_all_projetos(skip=skip, limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search)
-        total = await service.count_projetos(include_inactive=include_inactive, status_projeto=status_projeto, search=search)
+        if after_nome is not None and after_id is not None:
+            # Ao seguir o cursor o cliente já tem o total da primeira página
+            items = await service.get_all_projetos(limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search, after_nome=after_nome, after_id=after_id)
+            total = None
+        else:
+            # Página e total na mesma consulta (count(*) OVER ())
+            items, total = await service.get_projetos_pagina(skip=skip, limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search)
+        next_cursor = {"after_nome": items[-1].nome, "after_id": items[-1].id} if len(items) == limit else None
         logger.info(f"[get_all_projetos] Sucesso - {len(items)} registros retornados de {total} total")
-        return {"items": items, "total": total}
+        # DTOs já validados no service: serializa direto com orjson, sem passar pelo jsonable_encoder
+        return ORJSONResponse({"items": [item.model_dump(by_alias=True) for item in items], "total": total, "next_cursor": next_cursor})
     except HTTPException as e:
         logger.warning(f"[get_all_projetos] HTTPException: {str(e.detail)}")
         raise e
@@ -201,9 +224,9 @@ async def get_projetos_detalhados(
     ativo: Optional[bool] = Query(None, description="Filtrar por projetos ativos ou inativos"),
     secao_id: Optional[int] = Query(None, description="Filtrar pela seção do projeto"),
     recurso: Optional[str] = Query(None, description="Pesquisar pelo nome do recurso alocado"),
-    com_alocacoes: Optional[bool] = Query(True, description="Filtrar projetos que possuem alocações")
+    com_alocacoes: Optional[bool] = Query(True, description="Filtrar projetos que possuem alocações"),
+    after_id: Optional[int] = Query(None, description="Cursor: id do último projeto da página anterior (ignora page)")
 ):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info("[get_projetos_detalhados] Início")
     try:
         items = await service.get_projetos_detalhados(
@@ -213,16 +236,19 @@ async def get_projetos_detalhados(
             ativo=ativo,
             com_alocacoes=com_alocacoes,
             secao_id=secao_id,
-            recurso=recurso
+            recurso=recurso,
+            after_id=after_id
         )
-        total = await service.count_projetos_detalhados(
+        # Assim como em GET /projetos/, o COUNT só é calculado fora da paginação por cursor
+        total = None if after_id is not None else await service.count_projetos_detalhados(
             search=search,
             ativo=ativo,
             com_alocacoes=com_alocacoes,
             secao_id=secao_id,
             recurso=recurso
         )
-        return {"items": items, "total": total}
+        next_cursor = {"after_id": items[-1].id} if len(items) == per_page else None
+        return ORJSONResponse({"items": [item.model_dump(by_alias=True) for item in items], "total": total, "next_cursor": next_cursor})
     except HTTPException as e:
         logger.warning("[get_projetos_detalhados] HTTPException: %s", str(e.detail))
         raise e
@@ -232,7 +258,6 @@ async def get_projetos_detalhados(
 
 @router.get("/{projeto_id}", response_model=ProjetoDTO)
 async def get_projeto(projeto_id: int, service: ProjetoService = Depends(get_projeto_service)):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info(f"[get_projeto] Início - projeto_id: {projeto_id}")
     try:
         projeto = await service.get_projeto_by_id(projeto_id)
@@ -251,7 +276,6 @@ async def get_projeto(projeto_id: int, service: ProjetoService = Depends(get_pro
 
 @router.put("/{projeto_id}", response_model=ProjetoDTO)
 async def update_projeto(projeto_id: int, projeto_update: ProjetoUpdateDTO, service: ProjetoService = Depends(get_projeto_service)):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info(f"[update_projeto] Início - projeto_id: {projeto_id}")
     logger.info(f"[update_projeto] Payload recebido: {projeto_update.model_dump(exclude_unset=True)}")
     try:
@@ -267,7 +291,6 @@ async def update_projeto(projeto_id: int, projeto_update: ProjetoUpdateDTO, serv
 
 @router.delete("/{projeto_id}", response_model=ProjetoDTO)
 async def delete_projeto(projeto_id: int, service: ProjetoService = Depends(get_projeto_service)):
-    logger = logging.getLogger("app.api.routes.projeto_routes")
     logger.info(f"[delete_projeto] Início - projeto_id: {projeto_id}")
     try:
         result = await service.delete_projeto(projeto_id)
@@ -347,6 +370,6 @@ async def save_planejamento_horas(
         await db.commit()
     except IntegrityError as e:
         await db.rollback()
-        raise HTTPException(status_code=400, detail="Dados inválidos: " + str(e.orig))
+        raise HTTPException(status_code=400, detail=unique_violation_detail(e) or "Dados inválidos: " + str(e.orig))
 
     return {"detail": "Horas planejadas salvas com sucesso", "itens_inseridos": len(novas)}
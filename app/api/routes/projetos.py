@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_async_db
+from app.utils.search_utils import contains_pattern
 from app.domain.models.projeto_model import Projeto
 from app.application.dtos.projeto_dtos import ProjetoDTO, ProjetoComAlocacoesCreateDTO, ProjetoUpdateDTO
 from app.application.services.projeto_service import ProjetoService
@@ -25,6 +26,7 @@ class ProjetoResponse(BaseModel):
 
 def get_projeto_service(db: AsyncSession = Depends(get_async_db)) -> ProjetoService:
     return ProjetoService(
+        db_session=db,
         projeto_repository=SQLAlchemyProjetoRepository(db),
         status_projeto_repository=SQLAlchemyStatusProjetoRepository(db),
         alocacao_repository=SQLAlchemyAlocacaoRepository(db),
@@ -46,7 +48,7 @@ def autocomplete_projetos(
     Endpoint para autocomplete de projetos por nome ou código da empresa.
     """
     query = db.query(Projeto)
-    query = query.filter(Projeto.nome.ilike(f"%{search}%"))
+    query = query.filter(Projeto.nome.ilike(contains_pattern(search), escape="/"))
     if apenas_ativos:
         query = query.filter(Projeto.ativo == True)
     if status_projeto:
@@ -63,11 +65,10 @@ def autocomplete_projetos(
 async def create_projeto_with_allocations(
     data: ProjetoComAlocacoesCreateDTO,
     service: ProjetoService = Depends(get_projeto_service),
-    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user_mock) # Substituir pela autenticação real
 ):
     try:
-        return await service.create_projeto_com_alocacoes(data, db)
+        return await service.create_projeto_com_alocacoes(data)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -90,9 +91,9 @@ def list_projetos(
     service = ProjetoService(db)
     query = db.query(Projeto)
     if nome:
-        query = query.filter(Projeto.nome.ilike(f"%{nome}%"))
+        query = query.filter(Projeto.nome.ilike(contains_pattern(nome), escape="/"))
     if codigo_empresa:
-        query = query.filter(Projeto.codigo_empresa.ilike(f"%{codigo_empresa}%"))
+        query = query.filter(Projeto.codigo_empresa.ilike(contains_pattern(codigo_empresa), escape="/"))
     if status_projeto is not None:
         query = query.filter(Projeto.status_projeto_id == status_projeto)
     if ativo is not None:
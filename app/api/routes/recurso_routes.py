@@ -16,7 +16,7 @@ router = APIRouter()
 async def get_recurso_service(db: AsyncSession = Depends(get_async_db)) -> RecursoService:
     recurso_repository = SQLAlchemyRecursoRepository(db_session=db)
     equipe_repository = SQLAlchemyEquipeRepository(db_session=db) # RecursoService needs this
-    return RecursoService(recurso_repository=recurso_repository, equipe_repository=equipe_repository)
+    return RecursoService(db_session=db, recurso_repository=recurso_repository, equipe_repository=equipe_repository)
 
 @router.get("/autocomplete", response_model=dict)
 async def autocomplete_recursos(
@@ -50,7 +50,7 @@ async def autocomplete_recursos(
 async def get_recurso_service(db: AsyncSession = Depends(get_async_db)) -> RecursoService:
     recurso_repository = SQLAlchemyRecursoRepository(db_session=db)
     equipe_repository = SQLAlchemyEquipeRepository(db_session=db) # RecursoService needs this
-    return RecursoService(recurso_repository=recurso_repository, equipe_repository=equipe_repository)
+    return RecursoService(db_session=db, recurso_repository=recurso_repository, equipe_repository=equipe_repository)
 
 @router.post("/", response_model=RecursoDTO, status_code=status.HTTP_201_CREATED)
 async def create_recurso(recurso_create_dto: RecursoCreateDTO, service: RecursoService = Depends(get_recurso_service)):
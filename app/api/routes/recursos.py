@@ -12,7 +12,7 @@ router = APIRouter(prefix="/recursos", tags=["Recursos"])
 
 from app.db.orm_models import Recurso
 from app.repositories.recurso_repository import RecursoRepository
-from app.utils.search_utils import apply_search_filter
+from app.utils.search_utils import apply_search_filter, contains_pattern
 from sqlalchemy.orm import Session
 
 @router.get("/autocomplete", response_model=dict)
@@ -103,11 +103,11 @@ def list_recursos(
                 )
             )
         # filtros específicos abaixo
-            query = query.filter(Recurso.nome.ilike(f"%{nome}%"))
+            query = query.filter(Recurso.nome.ilike(contains_pattern(nome), escape="/"))
         if email:
-            query = query.filter(Recurso.email.ilike(f"%{email}%"))
+            query = query.filter(Recurso.email.ilike(contains_pattern(email), escape="/"))
         if matricula:
-            query = query.filter(Recurso.matricula.ilike(f"%{matricula}%"))
+            query = query.filter(Recurso.matricula.ilike(contains_pattern(matricula), escape="/"))
         if equipe_id is not None:
             query = query.filter(Recurso.equipe_principal_id == equipe_id)
         if ativo is not None:
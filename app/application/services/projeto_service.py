@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.db.orm_models import Projeto, AlocacaoRecursoProjeto, HorasPlanejadas
 from app.application.dtos.projeto_dtos import ProjetoBaseDTO, ProjetoUpdateDTO, ProjetoDTO, ProjetoComAlocacoesCreateDTO
 from app.application.dtos.projeto_detalhado_dtos import ProjetoDetalhadoDTO
@@ -8,15 +8,27 @@ from app.repositories.alocacao_repository import AlocacaoRepository
 from app.repositories.planejamento_horas_repository import PlanejamentoHorasRepository as HorasPlanejadasRepository
 from app.repositories.recurso_repository import RecursoRepository
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Valida a página inteira de projetos detalhados em uma única chamada ao validador compilado
+_PROJETOS_DETALHADOS_ADAPTER = TypeAdapter(List[ProjetoDetalhadoDTO])
+
 class ProjetoService:
+    """
+    Casos de uso de projeto. Os repositórios não fazem commit: cada operação de escrita confirma
+    a transação da sessão compartilhada uma única vez, ao final. Em caso de erro nada é
+    confirmado e o rollback ocorre ao fechar a sessão (get_async_db).
+    """
+
     def __init__(self,
+                 db_session: AsyncSession,
                  projeto_repository: ProjetoRepository,
                  status_projeto_repository: StatusProjetoRepository,
                  alocacao_repository: AlocacaoRepository,
                  horas_planejadas_repository: HorasPlanejadasRepository,
                  recurso_repository: RecursoRepository):
+        self.db_session = db_session
         self.projeto_repository = projeto_repository
         self.status_projeto_repository = status_projeto_repository
         self.alocacao_repository = alocacao_repository
@@ -29,20 +41,27 @@ class ProjetoService:
             return ProjetoDTO.model_validate(projeto)
         return None
 
-    async def get_all_projetos(self, skip: int = 0, limit: int = 100, include_inactive: bool = False, status_projeto: Optional[int] = None, search: Optional[str] = None) -> List[ProjetoDTO]:
-        projetos = await self.projeto_repository.get_all(skip=skip, limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search)
-        return [ProjetoDTO.model_validate(p) for p in projetos]
+    async def get_all_projetos(self, skip: int = 0, limit: int = 100, include_inactive: bool = False, status_projeto: Optional[int] = None, search: Optional[str] = None, after_nome: Optional[str] = None, after_id: Optional[int] = None) -> List[ProjetoDTO]:
+        projetos = await self.projeto_repository.get_all(skip=skip, limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search, after_nome=after_nome, after_id=after_id)
+        # Linhas já vêm tipadas do banco via model_construct; revalidar cada uma com from_attributes
+        # só duplicaria o custo por linha na listagem.
+        return [ProjetoDTO.model_construct(**vars(p)) for p in projetos]
+
+    async def get_projetos_pagina(self, skip: int = 0, limit: int = 100, include_inactive: bool = False, status_projeto: Optional[int] = None, search: Optional[str] = None) -> Tuple[List[ProjetoDTO], int]:
+        """Página de projetos e total filtrado, obtidos em uma única consulta."""
+        projetos, total = await self.projeto_repository.get_page(skip=skip, limit=limit, include_inactive=include_inactive, status_projeto=status_projeto, search=search)
+        return [ProjetoDTO.model_construct(**vars(p)) for p in projetos], total
 
     async def count_projetos(self, include_inactive: bool = False, status_projeto: Optional[int] = None, search: Optional[str] = None) -> int:
         """Retorna a contagem total de projetos aplicando os mesmos filtros da listagem."""
         return await self.projeto_repository.count(include_inactive=include_inactive, status_projeto=status_projeto, search=search)
 
-    async def create_projeto_com_alocacoes(self, data: ProjetoComAlocacoesCreateDTO, db_session: AsyncSession) -> ProjetoDTO:
+    async def create_projeto_com_alocacoes(self, data: ProjetoComAlocacoesCreateDTO) -> ProjetoDTO:
         """
         Cria um projeto completo, incluindo suas alocações de recursos e as horas planejadas para cada alocação.
         Este método opera dentro de uma única transação para garantir a atomicidade.
         """
-        async with db_session.begin():
+        async with self.db_session.begin():
             projeto_data_dto = data.projeto
 
             # Validações
@@ -60,12 +79,16 @@ class ProjetoService:
 
             # 2. Iterar e Criar Alocações e Horas Planejadas
             if data.alocacoes:
-                for aloc_dto in data.alocacoes:
-                    # Converte Alocacao DTO para dict se necessário
-                    aloc_dict_src = aloc_dto if isinstance(aloc_dto, dict) else aloc_dto.model_dump()
+                # Converte Alocacao DTOs para dict se necessário
+                alocacoes_src = [a if isinstance(a, dict) else a.model_dump() for a in data.alocacoes]
+                # Valida todos os recursos com uma única consulta em vez de um get_by_id por alocação
+                recursos_existentes = await self.recurso_repository.get_existing_ids(
+                    [a["recurso_id"] for a in alocacoes_src]
+                )
+                for aloc_dict_src in alocacoes_src:
                     recurso_id = aloc_dict_src["recurso_id"]
-                    if not await self.recurso_repository.get_by_id(recurso_id):
-                        raise HTTPException(status_code=400, detail=f"Recurso com ID {aloc_dto.recurso_id} não encontrado.")
+                    if recurso_id not in recursos_existentes:
+                        raise HTTPException(status_code=400, detail=f"Recurso com ID {recurso_id} não encontrado.")
 
                     alocacao_dict = {
                         "recurso_id": recurso_id,
@@ -109,6 +132,7 @@ class ProjetoService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Projeto com Jira Project Key '{projeto_create_dto.jira_project_key}' já existe.")
 
         projeto = await self.projeto_repository.create(projeto_create_dto)
+        await self.db_session.commit()
         return ProjetoDTO.model_validate(projeto)
 
     async def update_projeto(self, projeto_id: int, projeto_update_dto: ProjetoUpdateDTO) -> Optional[ProjetoDTO]:
@@ -136,6 +160,7 @@ class ProjetoService:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Outro projeto com Jira Project Key '{projeto_update_dto.jira_project_key}' já existe.")
 
         projeto = await self.projeto_repository.update(projeto_id, projeto_update_dto)
+        await self.db_session.commit()
         if projeto:
             return ProjetoDTO.model_validate(projeto)
         return None
@@ -149,6 +174,7 @@ class ProjetoService:
         com_alocacoes: bool = True,
         secao_id: Optional[int] = None,
         recurso: Optional[str] = None,
+        after_id: Optional[int] = None,
     ) -> List[ProjetoDetalhadoDTO]:
         skip = (page - 1) * per_page
         projetos = await self.projeto_repository.list_detalhados(
@@ -159,8 +185,9 @@ class ProjetoService:
             com_alocacoes=com_alocacoes,
             secao_id=secao_id,
             recurso=recurso,
+            after_id=after_id,
         )
-        return [ProjetoDetalhadoDTO.model_validate(p) for p in projetos]
+        return _PROJETOS_DETALHADOS_ADAPTER.validate_python(projetos, from_attributes=True)
 
     async def count_projetos_detalhados(
         self,
@@ -182,6 +209,7 @@ class ProjetoService:
     async def delete_projeto(self, projeto_id: int) -> Optional[ProjetoDTO]:
         # Add logic here to check if projeto can be deleted (e.g., no active alocacoes or apontamentos)
         projeto_deletado = await self.projeto_repository.delete(projeto_id)
+        await self.db_session.commit()
         if projeto_deletado:
             return ProjetoDTO.model_validate(projeto_deletado)
         return None
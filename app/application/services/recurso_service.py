@@ -4,9 +4,16 @@ from app.application.dtos.recurso_dtos import RecursoCreateDTO, RecursoUpdateDTO
 from app.domain.repositories.recurso_repository import RecursoRepository
 from app.domain.repositories.equipe_repository import EquipeRepository # To check if equipe_id exists
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 class RecursoService:
-    def __init__(self, recurso_repository: RecursoRepository, equipe_repository: EquipeRepository):
+    """
+    Casos de uso de recurso. Os repositórios não fazem commit: cada operação de escrita confirma
+    a transação da sessão compartilhada uma única vez, ao final.
+    """
+
+    def __init__(self, db_session: AsyncSession, recurso_repository: RecursoRepository, equipe_repository: EquipeRepository):
+        self.db_session = db_session
         self.recurso_repository = recurso_repository
         self.equipe_repository = equipe_repository
 
@@ -68,6 +75,7 @@ class RecursoService:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Equipe principal com ID {recurso_create_dto.equipe_principal_id} não está ativa.")
 
         recurso = await self.recurso_repository.create(recurso_create_dto)
+        await self.db_session.commit()
         return RecursoDTO.model_validate(recurso)
 
     async def update_recurso(self, recurso_id: int, recurso_update_dto: RecursoUpdateDTO) -> Optional[RecursoDTO]:
@@ -103,6 +111,7 @@ class RecursoService:
                  raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Nova equipe principal com ID {recurso_update_dto.equipe_principal_id} não está ativa.")
 
         recurso = await self.recurso_repository.update(recurso_id, recurso_update_dto)
+        await self.db_session.commit()
         if recurso:
             return RecursoDTO.model_validate(recurso)
         return None
@@ -110,6 +119,7 @@ class RecursoService:
     async def delete_recurso(self, recurso_id: int) -> Optional[RecursoDTO]:
         # Add logic here to check if recurso can be deleted (e.g., no active alocacoes)
         recurso_deletado = await self.recurso_repository.delete(recurso_id)
+        await self.db_session.commit()
         if recurso_deletado:
             return RecursoDTO.model_validate(recurso_deletado)
         return None
@@ -19,6 +19,25 @@ class Settings(BaseSettings):
     DB_PORT: str = ""
     DB_NAME: str = ""
     
+    # Pool de conexões do SQLAlchemy (por processo/worker)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # Tempo máximo (s) de um comando no asyncpg
+    DB_COMMAND_TIMEOUT: int = 60
+    # True quando DB_HOST/DB_PORT apontam para um PgBouncer em pool_mode=transaction
+    DB_PGBOUNCER: bool = False
+    
+    # Cache em memória (TTL 60s) das buscas de projeto por nome/código/chave Jira.
+    # Só habilite com uma única instância: a invalidação é local ao processo.
+    PROJETO_LOOKUP_CACHE: bool = False
+    # Idem para as buscas de recurso por email/matrícula/ID do usuário Jira
+    RECURSO_LOOKUP_CACHE: bool = False
+    # Idem para a listagem de status de projeto (TTL 300s)
+    STATUS_PROJETO_CACHE: bool = False
+    
+    # Log de SQL do SQLAlchemy (apenas para debug; mantenha False em produção)
+    SQL_ECHO: bool = False
+    
     # Segurança (lidos do .env)
     SECRET_KEY: str = ""
     ALGORITHM: str = "HS256"
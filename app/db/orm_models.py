@@ -1,8 +1,9 @@
 from datetime import datetime, date
 from decimal import Decimal
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Float, ForeignKey, Enum, UniqueConstraint, CheckConstraint, DECIMAL, SmallInteger, TIMESTAMP, Table
-from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from typing import List, Optional
+from sqlalchemy import FetchedValue, Column, Index, Integer, String, Text, Boolean, DateTime, Date, Float, ForeignKey, Enum, UniqueConstraint, CheckConstraint, DECIMAL, Numeric, SmallInteger, TIMESTAMP, Table
+from sqlalchemy.sql import func, literal_column, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum as PyEnum
 
 from app.db.session import Base
@@ -27,37 +28,45 @@ class UserRole(str, PyEnum):
     RECURSO = "recurso"
 
 # Modelos ORM baseados no esquema do BD v1.2
+#
+# data_criacao/data_atualizacao são preenchidas pelo banco: DEFAULT now() no INSERT
+# e o trigger tg_set_data_atualizacao no UPDATE (migração 20261018_ts_defaults). O trigger
+# só carimba now() quando o UPDATE não altera data_atualizacao; um valor explícito
+# (ex.: o 'updated' do Jira no upsert de apontamentos) é mantido (20261018_ts_trigger_explicit).
 
 class Secao(Base):
     __tablename__ = "secao"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    nome = Column(String(100), nullable=False, unique=True)
-    descricao = Column(Text, nullable=True)
-    jira_project_key = Column(String(20), nullable=True, unique=True, index=True)  # Chave do Jira para vinculação
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    ativo = Column(Boolean, nullable=False, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    nome: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    descricao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    jira_project_key: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, unique=True, index=True)  # Chave do Jira para vinculação
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    ativo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     
     # Relacionamentos
-    equipes = relationship("Equipe", back_populates="secao")
+    equipes: Mapped[List["Equipe"]] = relationship("Equipe", back_populates="secao")
 
 class Equipe(Base):
     __tablename__ = "equipe"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    secao_id = Column(Integer, ForeignKey("secao.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
-    nome = Column(String(100), nullable=False)
-    descricao = Column(Text, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    ativo = Column(Boolean, nullable=False, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    secao_id: Mapped[int] = mapped_column(Integer, ForeignKey("secao.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
+    nome: Mapped[str] = mapped_column(String(100), nullable=False)
+    descricao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    ativo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     
     # Relacionamentos
-    secao = relationship("Secao", back_populates="equipes")
-    recursos = relationship("Recurso", back_populates="equipe_principal")
-    # Associação N:N com projetos
-    projetos = relationship(
+    secao: Mapped["Secao"] = relationship("Secao", back_populates="equipes")
+    recursos: Mapped[List["Recurso"]] = relationship("Recurso", back_populates="equipe_principal")
+    # Associação N:N com projetos. Fica lazy de propósito: ninguém lê esta coleção
+    # hoje e selectin por padrão custaria um SELECT extra em todo carregamento de
+    # Equipe. Quem precisar deve usar options(selectinload(Equipe.projetos)), que
+    # faz um único SELECT ... WHERE equipe_id IN (...) sem multiplicar linhas.
+    projetos: Mapped[List["Projeto"]] = relationship(
         "Projeto",
         secondary=equipe_projeto_association,
         back_populates="equipes"
@@ -71,90 +80,99 @@ class Equipe(Base):
 class Recurso(Base):
     __tablename__ = "recurso"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    equipe_principal_id = Column(Integer, ForeignKey("equipe.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
-    nome = Column(String(150), nullable=False)
-    email = Column(String(100), nullable=False, unique=True, index=True)
-    matricula = Column(String(50), nullable=True, unique=True, index=True)
-    cargo = Column(String(100), nullable=True)
-    jira_user_id = Column(String(100), nullable=True, unique=True, index=True)
-    data_admissao = Column(Date, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    ativo = Column(Boolean, nullable=False, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    equipe_principal_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("equipe.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
+    nome: Mapped[str] = mapped_column(String(150), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
+    matricula: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, unique=True, index=True)
+    cargo: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    jira_user_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, unique=True, index=True)
+    data_admissao: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    ativo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     
     # Relacionamentos
-    equipe_principal = relationship("Equipe", back_populates="recursos")
-    usuario = relationship("Usuario", back_populates="recurso", uselist=False)
-    alocacoes = relationship("AlocacaoRecursoProjeto", back_populates="recurso")
-    horas_disponiveis = relationship("HorasDisponiveisRH", back_populates="recurso")
-    apontamentos = relationship("Apontamento", back_populates="recurso")
+    equipe_principal: Mapped[Optional["Equipe"]] = relationship("Equipe", back_populates="recursos")
+    usuario: Mapped[Optional["Usuario"]] = relationship("Usuario", back_populates="recurso", uselist=False)
+    alocacoes: Mapped[List["AlocacaoRecursoProjeto"]] = relationship("AlocacaoRecursoProjeto", back_populates="recurso")
+    horas_disponiveis: Mapped[List["HorasDisponiveisRH"]] = relationship("HorasDisponiveisRH", back_populates="recurso")
+    apontamentos: Mapped[List["Apontamento"]] = relationship("Apontamento", back_populates="recurso")
 
 class StatusProjeto(Base):
     __tablename__ = "status_projeto"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    nome = Column(String(50), nullable=False, unique=True)
-    descricao = Column(String(255), nullable=True)
-    is_final = Column(Boolean, nullable=False, default=False)
-    ordem_exibicao = Column(Integer, nullable=True, unique=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    nome: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+    descricao: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    is_final: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    ordem_exibicao: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, unique=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
     
     # Relacionamentos
-    projetos = relationship("Projeto", back_populates="status")
+    projetos: Mapped[List["Projeto"]] = relationship("Projeto", back_populates="status")
 
 class Projeto(Base):
     __tablename__ = "projeto"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    nome = Column(String(200), nullable=False)
-    codigo_empresa = Column(String(50), nullable=True, unique=True, index=True)
-    descricao = Column(Text, nullable=True)
-    jira_project_key = Column(String(100), nullable=True, index=True)  # unique=False para permitir múltiplos projetos com a mesma key
-    status_projeto_id = Column(Integer, ForeignKey("status_projeto.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
-    secao_id = Column(Integer, ForeignKey("secao.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=True, index=True)
-    data_inicio_prevista = Column(Date, nullable=True)
-    data_fim_prevista = Column(Date, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    ativo = Column(Boolean, nullable=False, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    nome: Mapped[str] = mapped_column(String(200), nullable=False)
+    codigo_empresa: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, unique=True, index=True)
+    descricao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    jira_project_key: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)  # unique=False para permitir múltiplos projetos com a mesma key
+    status_projeto_id: Mapped[int] = mapped_column(Integer, ForeignKey("status_projeto.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
+    secao_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("secao.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=True, index=True)
+    data_inicio_prevista: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    data_fim_prevista: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    ativo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     
     # Relacionamentos
-    status = relationship("StatusProjeto", back_populates="projetos")
-    secao = relationship("Secao")
-    alocacoes = relationship("AlocacaoRecursoProjeto", back_populates="projeto")
-    apontamentos = relationship("Apontamento", back_populates="projeto", foreign_keys="Apontamento.projeto_id")
-    # Associação N:N com equipes
-    equipes = relationship(
+    status: Mapped["StatusProjeto"] = relationship("StatusProjeto", back_populates="projetos")
+    secao: Mapped[Optional["Secao"]] = relationship("Secao")
+    alocacoes: Mapped[List["AlocacaoRecursoProjeto"]] = relationship("AlocacaoRecursoProjeto", back_populates="projeto")
+    apontamentos: Mapped[List["Apontamento"]] = relationship("Apontamento", back_populates="projeto", foreign_keys="Apontamento.projeto_id")
+    # Associação N:N com equipes (ver nota em Equipe.projetos; usar selectinload)
+    equipes: Mapped[List["Equipe"]] = relationship(
         "Equipe",
         secondary=equipe_projeto_association,
         back_populates="projetos"
     )
 
+    # Índices trigram (pg_trgm) para a busca ILIKE '%termo%' da listagem (migração 20261018_projeto_trgm)
+    __table_args__ = (
+        Index('idx_projeto_nome_trgm', 'nome', postgresql_using='gin', postgresql_ops={'nome': 'gin_trgm_ops'}),
+        Index('idx_projeto_codigo_empresa_trgm', 'codigo_empresa', postgresql_using='gin', postgresql_ops={'codigo_empresa': 'gin_trgm_ops'}),
+        Index('idx_projeto_descricao_trgm', 'descricao', postgresql_using='gin', postgresql_ops={'descricao': 'gin_trgm_ops'}),
+        Index('idx_projeto_nome_id', 'nome', 'id'),
+        Index('idx_projeto_ativo_secao', 'ativo', 'secao_id', postgresql_include=['id']),
+    )
+
 class AlocacaoRecursoProjeto(Base):
     __tablename__ = "alocacao_recurso_projeto"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    recurso_id = Column(Integer, ForeignKey("recurso.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
-    projeto_id = Column(Integer, ForeignKey("projeto.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
-    equipe_id = Column(Integer, ForeignKey("equipe.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
-    status_alocacao_id = Column(Integer, ForeignKey("status_projeto.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
-    observacao = Column(Text, nullable=True)
-    data_inicio_alocacao = Column(Date, nullable=False)
-    data_fim_alocacao = Column(Date, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    esforco_estimado = Column(DECIMAL(10, 2), nullable=True)
-    esforco_planejado = Column(DECIMAL(10, 2), nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    recurso_id: Mapped[int] = mapped_column(Integer, ForeignKey("recurso.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
+    projeto_id: Mapped[int] = mapped_column(Integer, ForeignKey("projeto.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
+    equipe_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("equipe.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
+    status_alocacao_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("status_projeto.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
+    observacao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    data_inicio_alocacao: Mapped[date] = mapped_column(Date, nullable=False)
+    data_fim_alocacao: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    esforco_estimado: Mapped[Optional[float]] = mapped_column(Numeric(10, 2, asdecimal=False), nullable=True)
+    esforco_planejado: Mapped[Optional[float]] = mapped_column(Numeric(10, 2, asdecimal=False), nullable=True)
 
     # Relacionamentos
-    recurso = relationship("Recurso", back_populates="alocacoes")
-    projeto = relationship("Projeto", back_populates="alocacoes")
-    equipe = relationship("Equipe")
-    status_alocacao = relationship("StatusProjeto")
+    recurso: Mapped["Recurso"] = relationship("Recurso", back_populates="alocacoes")
+    projeto: Mapped["Projeto"] = relationship("Projeto", back_populates="alocacoes")
+    equipe: Mapped[Optional["Equipe"]] = relationship("Equipe")
+    status_alocacao: Mapped[Optional["StatusProjeto"]] = relationship("StatusProjeto")
     # Evita que o SQLAlchemy faça UPDATE definindo alocacao_id=NULL antes do DELETE.
-    horas_planejadas = relationship(
+    horas_planejadas: Mapped[List["HorasPlanejadas"]] = relationship(
         "HorasPlanejadas",
         back_populates="alocacao",
         passive_deletes=True,
@@ -166,19 +184,30 @@ class AlocacaoRecursoProjeto(Base):
         CheckConstraint('data_fim_alocacao IS NULL OR data_fim_alocacao >= data_inicio_alocacao', name='chk_alocacao_datas'),
     )
 
+# Período da alocação como daterange fechado; data_fim_alocacao NULL = sem fim.
+# Consultas de sobreposição usam periodo_alocacao(...).op("&&") para aproveitar o índice GiST.
+def periodo_alocacao(inicio, fim):
+    return func.daterange(inicio, fim, literal_column("'[]'"))
+
+Index(
+    'idx_alocacao_periodo_gist',
+    periodo_alocacao(AlocacaoRecursoProjeto.data_inicio_alocacao, AlocacaoRecursoProjeto.data_fim_alocacao),
+    postgresql_using='gist',
+)
+
 class HorasDisponiveisRH(Base):
     __tablename__ = "horas_disponiveis_rh"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    recurso_id = Column(Integer, ForeignKey("recurso.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
-    ano = Column(SmallInteger, nullable=False)
-    mes = Column(Integer, nullable=False)
-    horas_disponiveis_mes = Column(DECIMAL(5, 2), nullable=False)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    recurso_id: Mapped[int] = mapped_column(Integer, ForeignKey("recurso.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
+    ano: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mes: Mapped[int] = mapped_column(Integer, nullable=False)
+    horas_disponiveis_mes: Mapped[float] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=False)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
     
     # Relacionamentos
-    recurso = relationship("Recurso", back_populates="horas_disponiveis")
+    recurso: Mapped["Recurso"] = relationship("Recurso", back_populates="horas_disponiveis")
     
     # Restrições
     __table_args__ = (
@@ -190,18 +219,18 @@ class HorasDisponiveisRH(Base):
 class HorasPlanejadas(Base):
     __tablename__ = "horas_planejadas_alocacao"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    alocacao_id = Column(Integer, ForeignKey("alocacao_recurso_projeto.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
-    ano = Column(SmallInteger, nullable=False)
-    mes = Column(Integer, nullable=False)
-    horas_planejadas = Column(DECIMAL(5, 2), nullable=False)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    alocacao_id: Mapped[int] = mapped_column(Integer, ForeignKey("alocacao_recurso_projeto.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
+    ano: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mes: Mapped[int] = mapped_column(Integer, nullable=False)
+    horas_planejadas: Mapped[float] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=False)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
     
     # Relacionamentos
     # Relacionamento configurado com passive_deletes para que o SQLAlchemy
     # deixe que o banco (ON DELETE CASCADE) remova os filhos sem emitir UPDATE.
-    alocacao = relationship(
+    alocacao: Mapped["AlocacaoRecursoProjeto"] = relationship(
         "AlocacaoRecursoProjeto",
         back_populates="horas_planejadas",
         passive_deletes=True,
@@ -217,130 +246,129 @@ class HorasPlanejadas(Base):
 class Apontamento(Base):
     __tablename__ = "apontamento"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    jira_worklog_id = Column(String(255), nullable=True, unique=True, index=True)
-    recurso_id = Column(Integer, ForeignKey("recurso.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
-    projeto_id = Column(Integer, ForeignKey("projeto.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, index=True)
-    jira_issue_key = Column(String(50), nullable=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    jira_worklog_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # unicidade via índice parcial em __table_args__
+    # recurso_id/projeto_id sem índice próprio: cobertos por idx_apontamento_recurso_data e
+    # idx_apontamento_projeto_data (coluna inicial), inclusive para as checagens das FKs
+    recurso_id: Mapped[int] = mapped_column(Integer, ForeignKey("recurso.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False)
+    projeto_id: Mapped[int] = mapped_column(Integer, ForeignKey("projeto.id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False)
+    jira_issue_key: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
     
     # Campos de hierarquia Jira
-    jira_parent_key = Column(String(50), nullable=True, index=True)  # Chave do item pai no Jira
-    jira_issue_type = Column(String(50), nullable=True)  # Tipo da issue (Task, Sub-task, Epic, etc)
-    nome_subtarefa = Column(String(255), nullable=True)  # Nome da subtarefa para rastreabilidade
-    projeto_pai_id = Column(Integer, ForeignKey("projeto.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)  # ID do projeto pai
-    nome_projeto_pai = Column(String(200), nullable=True)  # Nome do projeto pai para referência
-    
-    data_hora_inicio_trabalho = Column(DateTime, nullable=True)
-    data_apontamento = Column(Date, nullable=False, index=True)
-    horas_apontadas = Column(DECIMAL(5, 2), nullable=False)
-    descricao = Column(Text, nullable=True)
-    fonte_apontamento = Column(Enum(FonteApontamento), nullable=False, default=FonteApontamento.MANUAL, index=True)
-    id_usuario_admin_criador = Column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
-    data_sincronizacao_jira = Column(DateTime, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    jira_parent_key: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)  # Chave do item pai no Jira
+    jira_issue_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Tipo da issue (Task, Sub-task, Epic, etc)
+    nome_subtarefa: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Nome da subtarefa para rastreabilidade
+    projeto_pai_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("projeto.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)  # ID do projeto pai
+    nome_projeto_pai: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)  # Nome do projeto pai para referência
+    
+    data_hora_inicio_trabalho: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    data_apontamento: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    horas_apontadas: Mapped[float] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=False)  # asdecimal=False: lido como float, sem Decimal por linha
+    descricao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Enum nativo do PostgreSQL: já gravado como OID de 4 bytes e comparado por valor interno,
+    # então trocar por SMALLINT + IntEnum não reduziria páginas e quebraria filtros/DTOs por nome
+    fonte_apontamento: Mapped[FonteApontamento] = mapped_column(Enum(FonteApontamento), nullable=False, default=FonteApontamento.MANUAL, index=True)
+    id_usuario_admin_criador: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
+    data_sincronizacao_jira: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
     
     # Relacionamentos
-    recurso = relationship("Recurso", back_populates="apontamentos")
-    projeto = relationship("Projeto", back_populates="apontamentos", foreign_keys=[projeto_id])
-    projeto_pai = relationship("Projeto", foreign_keys=[projeto_pai_id])  # Relacionamento com projeto pai
-    usuario_criador = relationship("Usuario", back_populates="apontamentos_criados")
+    recurso: Mapped["Recurso"] = relationship("Recurso", back_populates="apontamentos")
+    projeto: Mapped["Projeto"] = relationship("Projeto", back_populates="apontamentos", foreign_keys=[projeto_id])
     
     # Restrições
     __table_args__ = (
         CheckConstraint('horas_apontadas > 0 AND horas_apontadas <= 24', name='chk_apontamento_horas'),
+        # Índices compostos para relatórios por recurso/projeto e período; o INCLUDE
+        # torna o índice cobridor para a soma de horas (index-only scan)
+        Index('idx_apontamento_recurso_data', 'recurso_id', 'data_apontamento', postgresql_include=['horas_apontadas']),
+        Index('idx_apontamento_projeto_data', 'projeto_id', 'data_apontamento', postgresql_include=['horas_apontadas']),
+        # Único só entre worklogs do Jira: apontamentos manuais (NULL) ficam fora do índice
+        Index('ux_apontamento_jira_worklog_id', 'jira_worklog_id', unique=True, postgresql_where=text('jira_worklog_id IS NOT NULL')),
     )
 
 class Usuario(Base):
     __tablename__ = "usuario"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    nome = Column(String(100), nullable=False)
-    email = Column(String(100), nullable=False, unique=True, index=True)
-    senha_hash = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), nullable=False)
-    recurso_id = Column(Integer, ForeignKey("recurso.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, unique=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
-    ultimo_acesso = Column(DateTime, nullable=True)
-    ativo = Column(Boolean, nullable=False, default=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    nome: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
+    senha_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    role: Mapped[UserRole] = mapped_column(Enum(UserRole), nullable=False)
+    recurso_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("recurso.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, unique=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
+    ultimo_acesso: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    ativo: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     
     # Relacionamentos
-    recurso = relationship("Recurso", back_populates="usuario")
-    apontamentos_criados = relationship("Apontamento", back_populates="usuario_criador")
-    logs = relationship("LogAtividade", back_populates="usuario")
-    sincronizacoes = relationship("SincronizacaoJira", back_populates="usuario")
+    recurso: Mapped[Optional["Recurso"]] = relationship("Recurso", back_populates="usuario")
 
 class Configuracao(Base):
     __tablename__ = "configuracao"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    chave = Column(String(100), nullable=False, unique=True)
-    valor = Column(Text, nullable=True)
-    descricao = Column(Text, nullable=True)
-    data_criacao = Column(DateTime, nullable=False, default=func.now())
-    data_atualizacao = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    chave: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    valor: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    descricao: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    data_criacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+    data_atualizacao: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(), server_onupdate=FetchedValue())
 
 class LogAtividade(Base):
     __tablename__ = "log_atividade"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
-    acao = Column(String(255), nullable=False)
-    tabela_afetada = Column(String(100), nullable=True)
-    registro_id = Column(String(255), nullable=True)
-    detalhes = Column(Text, nullable=True)
-    ip_origem = Column(String(45), nullable=True)
-    data_hora = Column(TIMESTAMP(6), nullable=False, default=func.now(), index=True)
-    
-    # Relacionamentos
-    usuario = relationship("Usuario", back_populates="logs")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    usuario_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True)
+    acao: Mapped[str] = mapped_column(String(255), nullable=False)
+    tabela_afetada: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    registro_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    detalhes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ip_origem: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    data_hora: Mapped[datetime] = mapped_column(TIMESTAMP(6), nullable=False, default=func.now(), index=True)
 
 class SincronizacaoJira(Base):
     __tablename__ = "sincronizacao_jira"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    data_inicio = Column(DateTime, nullable=False)
-    data_fim = Column(DateTime, nullable=True)  # Pode ser NULL durante o processamento
-    status = Column(String(50), nullable=False)
-    mensagem = Column(Text, nullable=True)
-    quantidade_apontamentos_processados = Column(Integer, nullable=True)
-    usuario_id = Column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True)
-    
-    # Relacionamentos
-    usuario = relationship("Usuario", back_populates="sincronizacoes")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    data_inicio: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    data_fim: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Pode ser NULL durante o processamento
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    mensagem: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    quantidade_apontamentos_processados: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    usuario_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("usuario.id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True)
 
 class DimTempo(Base):
     __tablename__ = "dim_tempo"
     
-    data_id = Column(Integer, primary_key=True)
-    data = Column(Date, nullable=False, unique=True)
-    ano = Column(SmallInteger, nullable=False)
-    mes = Column(Integer, nullable=False)
-    dia = Column(Integer, nullable=False)
-    trimestre = Column(Integer, nullable=False)
-    dia_semana = Column(Integer, nullable=False)
-    nome_dia_semana = Column(String(20), nullable=False)
-    nome_mes = Column(String(20), nullable=False)
-    semana_ano = Column(Integer, nullable=False)
-    is_dia_util = Column(Boolean, nullable=False)
-    is_feriado = Column(Boolean, nullable=False, default=False)
-    nome_feriado = Column(String(100), nullable=True)
+    data_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    data: Mapped[date] = mapped_column(Date, nullable=False, unique=True)
+    ano: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mes: Mapped[int] = mapped_column(Integer, nullable=False)
+    dia: Mapped[int] = mapped_column(Integer, nullable=False)
+    trimestre: Mapped[int] = mapped_column(Integer, nullable=False)
+    dia_semana: Mapped[int] = mapped_column(Integer, nullable=False)
+    nome_dia_semana: Mapped[str] = mapped_column(String(20), nullable=False)
+    nome_mes: Mapped[str] = mapped_column(String(20), nullable=False)
+    semana_ano: Mapped[int] = mapped_column(Integer, nullable=False)
+    is_dia_util: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    is_feriado: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    nome_feriado: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
 class DashboardJiraSnapshot(Base):
     """Tabela para armazenar snapshots dos dados do dashboard Jira"""
     __tablename__ = "dashboard_jira_snapshot"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    secao = Column(String(10), nullable=False, index=True)  # DTIN, SEG, SGI
-    dashboard_tipo = Column(String(50), nullable=False, index=True)  # demandas, melhorias, recursos_alocados
-    status = Column(String(100), nullable=False)  # Status da issue
-    quantidade = Column(Integer, nullable=False)  # Quantidade de issues
-    percentual = Column(DECIMAL(5,2), nullable=False)  # Percentual do total
-    data_snapshot = Column(DateTime, nullable=False, index=True)  # Quando foi capturado
-    filtros_aplicados = Column(Text, nullable=True)  # JSON com filtros usados na captura
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    secao: Mapped[str] = mapped_column(String(10), nullable=False, index=True)  # DTIN, SEG, SGI
+    dashboard_tipo: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # demandas, melhorias, recursos_alocados
+    status: Mapped[str] = mapped_column(String(100), nullable=False)  # Status da issue
+    quantidade: Mapped[int] = mapped_column(Integer, nullable=False)  # Quantidade de issues
+    percentual: Mapped[Decimal] = mapped_column(DECIMAL(5,2), nullable=False)  # Percentual do total
+    data_snapshot: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)  # Quando foi capturado
+    filtros_aplicados: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON com filtros usados na captura
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
     
     # Índices compostos para performance
     __table_args__ = (
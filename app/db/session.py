@@ -1,27 +1,64 @@
+from functools import lru_cache
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from sqlalchemy.inspection import inspect
 from fastapi import Depends
 
 from app.core.config import settings
 
+# Com PgBouncer em modo transaction (DB_PGBOUNCER=true, normalmente porta 6432) muitas
+# conexões de workers são multiplexadas em poucas conexões reais do PostgreSQL. Nesse modo
+# cada transação pode cair em um backend diferente, então prepared statements nomeados não
+# podem ser reaproveitados: desligamos o cache do asyncpg e o do dialeto do SQLAlchemy.
+# PgBouncer sugerido: pool_mode = transaction, default_pool_size = 25, max_client_conn = 1000,
+# ignore_startup_parameters = jit,tcp_keepalives_idle (server_settings enviados abaixo).
+# Conectando direto no PostgreSQL, os caches sobem do padrão (100) para 200 statements por
+# conexão, cobrindo todas as consultas repetidas dos repositórios sem replanejar.
+_statement_cache_args = (
+    {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    if settings.DB_PGBOUNCER
+    else {"statement_cache_size": 200, "prepared_statement_cache_size": 200}
+)
+
 async_engine = create_async_engine(
     settings.DATABASE_URI,
-    echo=False,  # Mantenha False para produção, True para debug de SQL
+    echo=settings.SQL_ECHO,  # SQL_ECHO=true no .env para debug de SQL
     pool_pre_ping=True,      # Garante que a conexão está viva antes de usar
     pool_recycle=1800,       # Recicla conexões antigas a cada 30 minutos
-    pool_size=10,            # Número de conexões simultâneas (ajuste conforme necessário)
-    max_overflow=20          # Número extra de conexões temporárias (ajuste conforme necessário)
+    poolclass=AsyncAdaptedQueuePool,        # Pool que espera conexão livre sem bloquear o event loop
+    pool_size=settings.DB_POOL_SIZE,        # Número de conexões simultâneas (DB_POOL_SIZE no .env)
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Número extra de conexões temporárias (DB_MAX_OVERFLOW no .env)
+    connect_args={
+        **_statement_cache_args,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "server_settings": {
+            # As consultas são curtas; o JIT do PostgreSQL só adiciona custo de compilação
+            "jit": "off",
+            "application_name": "pmo-backend",
+            # Keepalive antes do timeout de ociosidade de NAT/PgBouncer derrubar a conexão
+            "tcp_keepalives_idle": "60",
+        },
+    },
+    pool_reset_on_return="rollback",
 )
 
 # Base para modelos ORM
-class CustomBase:
+class Base(DeclarativeBase):
+    # Valores gerados pelo banco (id, data_criacao, data_atualizacao) voltam no
+    # próprio INSERT/UPDATE via RETURNING, sem um SELECT extra depois do flush.
+    __mapper_args__ = {"eager_defaults": True}
+
     def to_dict(self):
         """Converte o objeto SQLAlchemy em um dicionário."""
-        return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+        return {chave: getattr(self, chave) for chave in _column_keys(type(self))}
 
-Base = declarative_base(cls=CustomBase)
+
+@lru_cache(maxsize=None)
+def _column_keys(cls) -> tuple:
+    """Chaves das colunas mapeadas, resolvidas uma vez por classe (to_dict roda por linha)."""
+    return tuple(c.key for c in inspect(cls).column_attrs)
 
 # Criar fábrica de sessão assíncrona
 AsyncSessionLocal = async_sessionmaker(
@@ -32,11 +69,17 @@ AsyncSessionLocal = async_sessionmaker(
 
 # Dependency para obter sessão do banco assíncrona
 async def get_async_db() -> AsyncSession:
-    """Dependency para injetar a sessão do banco assíncrona."""
+    """
+    Dependency para injetar a sessão do banco assíncrona.
+
+    Todos os repositórios assíncronos (app/repositories e app/infrastructure/repositories)
+    recebem esta sessão, que sai do pool único do async_engine acima.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            # O commit foi removido daqui. Ele deve ser feito nas operações de escrita do repositório.
+            # O commit não é feito aqui: cada serviço confirma a própria transação de escrita
+            # (os repositórios não fazem commit).
         except Exception:
             await session.rollback() # Rollback em caso de exceção durante o uso da sessão
             raise
@@ -49,12 +92,14 @@ get_db = get_async_db
 # --- Sessão síncrona para endpoints legados ---
 sync_engine = create_engine(
     settings.DATABASE_URI.replace('+asyncpg', ''),
+    echo=settings.SQL_ECHO,
     pool_pre_ping=True,
     pool_recycle=1800,
-    pool_size=10,
-    max_overflow=20
+    connect_args={"application_name": "pmo-backend-sync", "keepalives_idle": 60},
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=sync_engine)
 
 def get_sync_db():
     db = SessionLocal()
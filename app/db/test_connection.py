@@ -1,23 +1,18 @@
 import sys
 import logging
-from sqlalchemy import create_engine, text
-from app.core.config import settings
+from sqlalchemy import text
+from app.db.session import sync_engine
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def test_connection():
     """Testar a conexão com o banco de dados PostgreSQL."""
     try:
-        # Criar engine de conexão com o PostgreSQL
-        engine = create_engine(settings.DATABASE_URI)
-        
-        # Testar conexão executando uma consulta simples
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT 1"))
-            for row in result:
-                logger.info(f"Conexão bem-sucedida: {row}")
+        # Reutiliza o pool da aplicação em vez de criar um engine a cada chamada
+        with sync_engine.connect() as connection:
+            # pg_is_in_recovery() também indica se estamos numa réplica somente leitura
+            em_recuperacao = connection.execute(text("SELECT pg_is_in_recovery()")).scalar()
+            logger.info(f"Conexão bem-sucedida (réplica: {em_recuperacao})")
             
         logger.info("Conexão com o banco de dados PostgreSQL estabelecida com sucesso!")
         return True
@@ -26,5 +21,6 @@ def test_connection():
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     success = test_connection()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
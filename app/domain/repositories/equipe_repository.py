@@ -24,6 +24,10 @@ class EquipeRepository(ABC):
     async def create(self, equipe_create_dto: EquipeCreateDTO) -> Equipe:
         pass
 
+    @abstractmethod
+    async def create_many(self, equipe_create_dtos: List[EquipeCreateDTO]) -> List[Equipe]:
+        pass
+
     @abstractmethod
     async def update(self, equipe_id: int, equipe_update_dto: EquipeUpdateDTO) -> Optional[Equipe]:
         pass
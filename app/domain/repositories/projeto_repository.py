@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.domain.models.projeto_model import Projeto
 from app.application.dtos.projeto_dtos import ProjetoCreateDTO, ProjetoUpdateDTO
 
@@ -8,6 +8,10 @@ class ProjetoRepository(ABC):
     async def get_by_id(self, projeto_id: int) -> Optional[Projeto]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, projeto_ids: List[int]) -> List[Projeto]:
+        pass
+
     @abstractmethod
     async def get_by_nome(self, nome: str) -> Optional[Projeto]:
         pass
@@ -21,13 +25,21 @@ class ProjetoRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, include_inactive: Optional[bool] = None) -> List[Projeto]:
+    async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, include_inactive: Optional[bool] = None, after_nome: Optional[str] = None, after_id: Optional[int] = None) -> List[Projeto]:
+        pass
+
+    @abstractmethod
+    async def get_page(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, include_inactive: Optional[bool] = None) -> Tuple[List[Projeto], int]:
         pass
 
     @abstractmethod
     async def create(self, projeto_create_dto: ProjetoCreateDTO) -> Projeto:
         pass
 
+    @abstractmethod
+    async def create_many(self, projeto_create_dtos: List[ProjetoCreateDTO]) -> List[Projeto]:
+        pass
+
     @abstractmethod
     async def update(self, projeto_id: int, projeto_update_dto: ProjetoUpdateDTO) -> Optional[Projeto]:
         pass
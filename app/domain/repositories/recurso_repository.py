@@ -28,6 +28,10 @@ class RecursoRepository(ABC):
     async def create(self, recurso_create_dto: RecursoCreateDTO) -> Recurso:
         pass
 
+    @abstractmethod
+    async def create_many(self, recurso_create_dtos: List[RecursoCreateDTO]) -> List[Recurso]:
+        pass
+
     @abstractmethod
     async def update(self, recurso_id: int, recurso_update_dto: RecursoUpdateDTO) -> Optional[Recurso]:
         pass
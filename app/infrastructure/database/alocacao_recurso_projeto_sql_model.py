@@ -19,16 +19,17 @@ class AlocacaoRecursoProjetoSQL(Base):
     data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    recurso = relationship("RecursoSQL")
-    projeto = relationship("ProjetoSQL")
-    equipe = relationship("EquipeSQL")
-    status_alocacao = relationship("StatusProjetoSQL")
+    recurso = relationship("RecursoSQL", lazy="raise_on_sql")
+    projeto = relationship("ProjetoSQL", lazy="raise_on_sql")
+    equipe = relationship("EquipeSQL", lazy="raise_on_sql")
+    status_alocacao = relationship("StatusProjetoSQL", lazy="raise_on_sql")
 
     # Relacionamento com horas planejadas - garante que o SQLAlchemy NÃO faça UPDATE
     # para NULL nos filhos durante a deleção da alocação. O banco (FK ON DELETE CASCADE)
     # cuidará da remoção.
     horas_planejadas = relationship(
         "HorasPlanejadasAlocacaoSQL",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
         passive_deletes=True,
         back_populates="alocacao",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, DECIMAL, Enum, ForeignKey, CheckConstraint, func
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Numeric, Enum, ForeignKey, CheckConstraint, Index, func, text
 from sqlalchemy.orm import relationship
 from app.infrastructure.database.database_config import Base
 
@@ -7,9 +7,10 @@ class ApontamentoSQL(Base):
     __tablename__ = "apontamento"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    jira_worklog_id = Column(String(255), unique=True, nullable=True)
-    recurso_id = Column(Integer, ForeignKey("recurso.id", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False, index=True)
-    projeto_id = Column(Integer, ForeignKey("projeto.id", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False, index=True)
+    jira_worklog_id = Column(String(255), nullable=True)
+    # Sem índice próprio: cobertos pelos índices compostos (recurso_id|projeto_id, data_apontamento)
+    recurso_id = Column(Integer, ForeignKey("recurso.id", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False)
+    projeto_id = Column(Integer, ForeignKey("projeto.id", onupdate="CASCADE", ondelete="RESTRICT"), nullable=False)
     jira_issue_key = Column(String(50), nullable=True)
     jira_parent_key = Column(String(50), nullable=True, index=True)
     jira_issue_type = Column(String(50), nullable=True, index=True)
@@ -18,7 +19,7 @@ class ApontamentoSQL(Base):
     nome_projeto_pai = Column(String(200), nullable=True)
     data_hora_inicio_trabalho = Column(DateTime(timezone=True), nullable=True)
     data_apontamento = Column(Date, nullable=False, index=True)
-    horas_apontadas = Column(DECIMAL(5, 2), nullable=False)
+    horas_apontadas = Column(Numeric(5, 2, asdecimal=False), nullable=False)
     descricao = Column(Text, nullable=True)
     fonte_apontamento = Column(Enum("JIRA", "MANUAL", name="fonteapontamento"), nullable=False)
     id_usuario_admin_criador = Column(Integer, ForeignKey("usuario.id", onupdate="CASCADE", ondelete="SET NULL"), nullable=True, index=True)
@@ -26,11 +27,14 @@ class ApontamentoSQL(Base):
     data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    recurso = relationship("RecursoSQL")
-    projeto = relationship("ProjetoSQL", foreign_keys=[projeto_id])
-    projeto_pai = relationship("ProjetoSQL", foreign_keys=[projeto_pai_id])
-    usuario_admin = relationship("UsuarioSQL", foreign_keys=[id_usuario_admin_criador])
+    recurso = relationship("RecursoSQL", lazy="raise_on_sql")
+    projeto = relationship("ProjetoSQL", foreign_keys=[projeto_id], lazy="raise_on_sql")
+    projeto_pai = relationship("ProjetoSQL", foreign_keys=[projeto_pai_id], lazy="raise_on_sql")
+    usuario_admin = relationship("UsuarioSQL", foreign_keys=[id_usuario_admin_criador], lazy="raise_on_sql")
 
     __table_args__ = (
         CheckConstraint("horas_apontadas > 0 AND horas_apontadas <= 24", name="chk_apontamento_horas"),
+        Index("idx_apontamento_recurso_data", "recurso_id", "data_apontamento", postgresql_include=["horas_apontadas"]),
+        Index("idx_apontamento_projeto_data", "projeto_id", "data_apontamento", postgresql_include=["horas_apontadas"]),
+        Index("ux_apontamento_jira_worklog_id", "jira_worklog_id", unique=True, postgresql_where=text("jira_worklog_id IS NOT NULL")),
     )
@@ -1,16 +1,10 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import declarative_base
-from app.core.config import settings
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from sqlalchemy.orm import DeclarativeBase
+from app.db.session import async_engine
 from typing import AsyncGenerator
 
-DATABASE_URL = settings.DATABASE_URI
-
-# 1. Crie um async_engine
-async_engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,  # Log SQL queries
-    future=True # Use a nova API do SQLAlchemy 2.0
-)
+# 1. Reutiliza o async_engine (asyncpg) de app.db.session para que as duas
+# camadas de repositório compartilhem o mesmo pool de conexões
 
 # 2. Crie um AsyncSessionLocal (fábrica de sessões assíncronas)
 AsyncSessionLocal = async_sessionmaker(
@@ -21,7 +15,8 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    __mapper_args__ = {"eager_defaults": True}
 
 # 3. Crie a dependência get_db assíncrona
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
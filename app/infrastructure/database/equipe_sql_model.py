@@ -10,9 +10,9 @@ class EquipeSQL(Base):
     secao_id = Column(Integer, ForeignKey("secao.id"), nullable=False, index=True)
     nome = Column(String(100), nullable=False)
     descricao = Column(Text, nullable=True)
-    data_criacao = Column(DateTime(timezone=True), nullable=False)
-    data_atualizacao = Column(DateTime(timezone=True), nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     ativo = Column(Boolean, nullable=False, default=True)
 
-    secao = relationship("SecaoSQL") # Define relationship to SecaoSQL if needed for ORM queries
+    secao = relationship("SecaoSQL", lazy="raise_on_sql") # Define relationship to SecaoSQL if needed for ORM queries
 
@@ -10,8 +10,8 @@ class HorasDisponiveisRhSQL(Base):
     recurso_id = Column(Integer, ForeignKey("recurso.id", onupdate="CASCADE", ondelete="CASCADE"), nullable=False, index=True)
     ano = Column(SmallInteger, nullable=False, index=True)
     mes = Column(Integer, nullable=False, index=True)
-    horas_disponiveis_mes = Column(Numeric(5,2), nullable=False)
+    horas_disponiveis_mes = Column(Numeric(5, 2, asdecimal=False), nullable=False)
     data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    recurso = relationship("RecursoSQL")
+    recurso = relationship("RecursoSQL", lazy="raise_on_sql")
@@ -10,7 +10,7 @@ class HorasPlanejadasAlocacaoSQL(Base):
     alocacao_id = Column(Integer, ForeignKey("alocacao_recurso_projeto.id", onupdate="CASCADE", ondelete="CASCADE"), nullable=False, index=True)
     ano = Column(SmallInteger, nullable=False, index=True)
     mes = Column(Integer, nullable=False, index=True)
-    horas_planejadas = Column(Numeric(5,2), nullable=False)
+    horas_planejadas = Column(Numeric(5, 2, asdecimal=False), nullable=False)
     data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
@@ -19,6 +19,7 @@ class HorasPlanejadasAlocacaoSQL(Base):
     # (which violates the NOT NULL constraint).
     alocacao = relationship(
         "AlocacaoRecursoProjetoSQL",
+        lazy="raise_on_sql",
         passive_deletes=True,
         back_populates="horas_planejadas",
     )
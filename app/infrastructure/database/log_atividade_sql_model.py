@@ -15,4 +15,4 @@ class LogAtividadeSQL(Base):
     ip_origem = Column(String(45), nullable=True)
     data_hora = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
-    usuario = relationship("UsuarioSQL")
+    usuario = relationship("UsuarioSQL", lazy="raise_on_sql")
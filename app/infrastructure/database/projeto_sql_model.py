@@ -16,10 +16,10 @@ class ProjetoSQL(Base):
     secao_id = Column(Integer, ForeignKey("secao.id", ondelete="RESTRICT"), nullable=True, index=True)
     data_inicio_prevista = Column(Date, nullable=True)
     data_fim_prevista = Column(Date, nullable=True)
-    data_criacao = Column(DateTime(timezone=True), nullable=False)
-    data_atualizacao = Column(DateTime(timezone=True), nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     ativo = Column(Boolean, nullable=False, default=True)
 
-    status_projeto = relationship("StatusProjetoSQL")
-    secao = relationship("SecaoSQL")
+    status_projeto = relationship("StatusProjetoSQL", lazy="raise_on_sql")
+    secao = relationship("SecaoSQL", lazy="raise_on_sql")
 
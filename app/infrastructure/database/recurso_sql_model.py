@@ -14,9 +14,9 @@ class RecursoSQL(Base):
     cargo = Column(String(100), nullable=True)
     jira_user_id = Column(String(100), unique=True, nullable=True, index=True)
     data_admissao = Column(Date, nullable=True)
-    data_criacao = Column(DateTime(timezone=True), nullable=False)
-    data_atualizacao = Column(DateTime(timezone=True), nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     ativo = Column(Boolean, nullable=False, default=True)
 
-    equipe_principal = relationship("EquipeSQL") # Define relationship to EquipeSQL
+    equipe_principal = relationship("EquipeSQL", lazy="raise_on_sql") # Define relationship to EquipeSQL
 
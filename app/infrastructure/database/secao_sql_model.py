@@ -9,6 +9,6 @@ class SecaoSQL(Base):
     nome = Column(String(100), nullable=False, unique=True)
     jira_project_key = Column(String(100), unique=True, nullable=True, index=True)
     descricao = Column(Text, nullable=True)
-    data_criacao = Column(DateTime(timezone=True), nullable=False)
-    data_atualizacao = Column(DateTime(timezone=True), nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     ativo = Column(Boolean, nullable=False, default=True)
@@ -14,4 +14,4 @@ class SincronizacaoJiraSQL(Base):
     quantidade_apontamentos_processados = Column(Integer, nullable=True)
     usuario_id = Column(Integer, ForeignKey("usuario.id", onupdate="CASCADE", ondelete="SET NULL"), nullable=True, index=True)
 
-    usuario = relationship("UsuarioSQL")
+    usuario = relationship("UsuarioSQL", lazy="raise_on_sql")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Enum, Boolean, DateTime, ForeignKey, func
 from sqlalchemy.orm import relationship
 from app.infrastructure.database.database_config import Base
 
@@ -11,9 +11,9 @@ class UsuarioSQL(Base):
     senha_hash = Column(String(255), nullable=False)
     role = Column(Enum("ADMIN", "GESTOR", "RECURSO", name="role"), nullable=False)
     recurso_id = Column(Integer, ForeignKey("recurso.id", onupdate="CASCADE", ondelete="SET NULL"), nullable=True, index=True)
-    data_criacao = Column(DateTime(timezone=True), nullable=False)
-    data_atualizacao = Column(DateTime(timezone=True), nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    data_atualizacao = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     ultimo_acesso = Column(DateTime(timezone=True), nullable=True)
     ativo = Column(Boolean, nullable=False)
 
-    recurso = relationship("RecursoSQL")
+    recurso = relationship("RecursoSQL", lazy="raise_on_sql")
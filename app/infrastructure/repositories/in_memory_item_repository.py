@@ -1,3 +1,4 @@
+import itertools
 from typing import List, Optional, Dict
 from app.domain.models.item_model import Item
 from app.application.dtos.item_dtos import ItemCreateDTO, ItemUpdateDTO
@@ -6,7 +7,7 @@ from app.domain.repositories.item_repository import ItemRepository
 class InMemoryItemRepository(ItemRepository):
     def __init__(self):
         self._items: Dict[int, Item] = {}
-        self._current_id: int = 0
+        self._id_gen = itertools.count(1)
 
     async def get_by_id(self, item_id: int) -> Optional[Item]:
         return self._items.get(item_id)
@@ -15,17 +16,16 @@ class InMemoryItemRepository(ItemRepository):
         return list(self._items.values())
 
     async def create(self, item_create_dto: ItemCreateDTO) -> Item:
-        self._current_id += 1
-        item = Item(id=self._current_id, description=item_create_dto.description)
-        self._items[self._current_id] = item
+        item_id = next(self._id_gen)
+        item = Item(id=item_id, description=item_create_dto.description)
+        self._items[item_id] = item
         return item
 
     async def update(self, item_id: int, item_update_dto: ItemUpdateDTO) -> Optional[Item]:
-        if item_id not in self._items:
+        item = self._items.get(item_id)
+        if item is None:
             return None
-        item = self._items[item_id]
         item.description = item_update_dto.description
-        self._items[item_id] = item
         return item
 
     async def delete(self, item_id: int) -> Optional[Item]:
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -10,15 +11,26 @@ from app.infrastructure.database.equipe_sql_model import EquipeSQL
 from app.infrastructure.database.recurso_sql_model import RecursoSQL  # Certifique-se de importar o modelo correto!
 from datetime import datetime, timezone
 
+# Colunas na ordem dos campos do modelo de domínio; as listagens montam o
+# DomainEquipe direto da linha, sem revalidar tipos já garantidos pelo banco.
+_EQUIPE_CAMPOS = tuple(DomainEquipe.model_fields)
+_EQUIPE_COLUMNS = tuple(getattr(EquipeSQL, campo) for campo in _EQUIPE_CAMPOS)
+_equipe_attrs = attrgetter(*_EQUIPE_CAMPOS)
+
+
+def _from_sql(equipe_sql: EquipeSQL) -> DomainEquipe:
+    """Monta o DomainEquipe a partir de uma linha do banco, sem revalidar os tipos."""
+    return DomainEquipe.model_construct(**dict(zip(_EQUIPE_CAMPOS, _equipe_attrs(equipe_sql))))
+
 class SQLAlchemyEquipeRepository(EquipeRepository):
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
     async def get_by_id(self, equipe_id: int) -> Optional[DomainEquipe]:
-        result = await self.db_session.execute(select(EquipeSQL).filter(EquipeSQL.id == equipe_id))
-        equipe_sql = result.scalars().first()
+        # session.get consulta primeiro o identity map: releituras na mesma sessão não vão ao banco
+        equipe_sql = await self.db_session.get(EquipeSQL, equipe_id)
         if equipe_sql:
-            return DomainEquipe.model_validate(equipe_sql)
+            return _from_sql(equipe_sql)
         return None
 
     async def get_by_nome_and_secao_id(self, nome: str, secao_id: int) -> Optional[DomainEquipe]:
@@ -27,64 +39,74 @@ class SQLAlchemyEquipeRepository(EquipeRepository):
         )
         equipe_sql = result.scalars().first()
         if equipe_sql:
-            return DomainEquipe.model_validate(equipe_sql)
+            return _from_sql(equipe_sql)
         return None
 
     async def get_all_by_secao_id(self, secao_id: int, skip: int = 0, limit: int = 100, apenas_ativos: bool = False) -> List[DomainEquipe]:
-        query = select(EquipeSQL).filter(EquipeSQL.secao_id == secao_id)
+        query = select(*_EQUIPE_COLUMNS).filter(EquipeSQL.secao_id == secao_id)
         if apenas_ativos:
             query = query.filter(EquipeSQL.ativo == True)
         query = query.offset(skip).limit(limit)
         result = await self.db_session.execute(query)
-        equipes_sql = result.scalars().all()
-        return [DomainEquipe.model_validate(equipe) for equipe in equipes_sql]
+        return [DomainEquipe.model_construct(**row) for row in result.mappings()]
 
     async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = False) -> List[DomainEquipe]:
-        query = select(EquipeSQL)
+        query = select(*_EQUIPE_COLUMNS)
         if apenas_ativos:
             query = query.filter(EquipeSQL.ativo == True)
         query = query.offset(skip).limit(limit)
         result = await self.db_session.execute(query)
-        equipes_sql = result.scalars().all()
-        return [DomainEquipe.model_validate(equipe) for equipe in equipes_sql]
+        return [DomainEquipe.model_construct(**row) for row in result.mappings()]
 
-    async def create(self, equipe_create_dto: EquipeCreateDTO) -> DomainEquipe:
-        new_equipe_sql = EquipeSQL(
+    @staticmethod
+    def _new_equipe_sql(equipe_create_dto: EquipeCreateDTO) -> EquipeSQL:
+        # data_criacao/data_atualizacao vêm do DEFAULT now() do banco (RETURNING no flush)
+        return EquipeSQL(
             nome=equipe_create_dto.nome,
             descricao=equipe_create_dto.descricao,
             secao_id=equipe_create_dto.secao_id,
-            data_criacao=datetime.now(timezone.utc),
-            data_atualizacao=datetime.now(timezone.utc),
             ativo=True
         )
+
+    async def create(self, equipe_create_dto: EquipeCreateDTO) -> DomainEquipe:
+        new_equipe_sql = self._new_equipe_sql(equipe_create_dto)
         self.db_session.add(new_equipe_sql)
+        # O INSERT já devolve o id (RETURNING) e a sessão não expira no commit: sem refresh.
         await self.db_session.commit()
-        await self.db_session.refresh(new_equipe_sql)
-        return DomainEquipe.model_validate(new_equipe_sql)
-
-    async def update(self, equipe_id: int, equipe_update_dto: EquipeUpdateDTO) -> Optional[DomainEquipe]:
-        equipe_sql = await self.db_session.get(EquipeSQL, equipe_id)
-        if not equipe_sql:
-            return None
+        return _from_sql(new_equipe_sql)
 
-        update_data = equipe_update_dto.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(equipe_sql, key, value)
+    async def create_many(self, equipe_create_dtos: List[EquipeCreateDTO]) -> List[DomainEquipe]:
+        """Cria várias equipes com um único flush (INSERT em lote) e um único commit."""
+        novas_equipes_sql = [self._new_equipe_sql(dto) for dto in equipe_create_dtos]
+        self.db_session.add_all(novas_equipes_sql)
+        await self.db_session.commit()
+        return [_from_sql(equipe_sql) for equipe_sql in novas_equipes_sql]
 
+    async def _update_returning(self, equipe_id: int, values: dict) -> Optional[DomainEquipe]:
+        """UPDATE ... RETURNING: grava e devolve a linha atualizada em uma única ida ao banco."""
+        query = (
+            sqlalchemy_update(EquipeSQL)
+            .where(EquipeSQL.id == equipe_id)
+            .values(**values)
+            .returning(EquipeSQL)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db_session.execute(query)
+        equipe_sql = result.scalar_one_or_none()
         await self.db_session.commit()
-        await self.db_session.refresh(equipe_sql)
-        return DomainEquipe.model_validate(equipe_sql)
+        if equipe_sql:
+            return _from_sql(equipe_sql)
+        return None
+
+    async def update(self, equipe_id: int, equipe_update_dto: EquipeUpdateDTO) -> Optional[DomainEquipe]:
+        update_data = equipe_update_dto.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_by_id(equipe_id)
+        return await self._update_returning(equipe_id, update_data)
 
     async def delete(self, equipe_id: int) -> Optional[DomainEquipe]:
         await check_dependents(self.db_session, RecursoSQL, "equipe_principal_id", equipe_id, "recursos")
 
-        equipe_to_delete_sql = await self.db_session.get(EquipeSQL, equipe_id)
-        if not equipe_to_delete_sql:
-            return None
-
-        equipe_to_delete_sql.ativo = False
-        equipe_to_delete_sql.data_atualizacao = datetime.now(timezone.utc)
-        await self.db_session.commit()
-        await self.db_session.refresh(equipe_to_delete_sql)
-
-        return DomainEquipe.model_validate(equipe_to_delete_sql)
\ No newline at end of file
+        return await self._update_returning(
+            equipe_id, {"ativo": False, "data_atualizacao": datetime.now(timezone.utc)}
+        )
\ No newline at end of file
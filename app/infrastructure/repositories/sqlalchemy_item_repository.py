@@ -16,20 +16,19 @@ class SQLAlchemyItemRepository(ItemRepository):
         result = await self.db_session.execute(select(ItemSQL).filter(ItemSQL.id == item_id))
         item_sql = result.scalars().first()
         if item_sql:
-            return DomainItem(id=item_sql.id, description=item_sql.description)
+            return DomainItem.model_construct(id=item_sql.id, description=item_sql.description)
         return None
 
     async def get_all(self) -> List[DomainItem]:
-        result = await self.db_session.execute(select(ItemSQL))
-        items_sql = result.scalars().all()
-        return [DomainItem(id=item.id, description=item.description) for item in items_sql]
+        result = await self.db_session.execute(select(ItemSQL.id, ItemSQL.description))
+        return [DomainItem.model_construct(**row) for row in result.mappings()]
 
     async def create(self, item_create_dto: ItemCreateDTO) -> DomainItem:
         new_item_sql = ItemSQL(description=item_create_dto.description)
         self.db_session.add(new_item_sql)
         await self.db_session.commit()
         await self.db_session.refresh(new_item_sql)
-        return DomainItem(id=new_item_sql.id, description=new_item_sql.description)
+        return DomainItem.model_construct(id=new_item_sql.id, description=new_item_sql.description)
 
     async def update(self, item_id: int, item_update_dto: ItemUpdateDTO) -> Optional[DomainItem]:
         stmt = (
@@ -42,16 +41,20 @@ class SQLAlchemyItemRepository(ItemRepository):
         updated_item_sql = result.scalars().first()
         await self.db_session.commit()
         if updated_item_sql:
-            return DomainItem(id=updated_item_sql.id, description=updated_item_sql.description)
+            return DomainItem.model_construct(id=updated_item_sql.id, description=updated_item_sql.description)
         return None
 
     async def delete(self, item_id: int) -> Optional[DomainItem]:
-        item_to_delete = await self.get_by_id(item_id) # Get domain item before deleting
-        if not item_to_delete:
-            return None
-        
-        stmt = sqlalchemy_delete(ItemSQL).where(ItemSQL.id == item_id)
-        await self.db_session.execute(stmt)
+        # DELETE ... RETURNING devolve o item removido sem um SELECT antes
+        stmt = (
+            sqlalchemy_delete(ItemSQL)
+            .where(ItemSQL.id == item_id)
+            .returning(ItemSQL.id, ItemSQL.description)
+        )
+        result = await self.db_session.execute(stmt)
+        deleted_row = result.first()
         await self.db_session.commit()
-        return item_to_delete
+        if deleted_row:
+            return DomainItem.model_construct(id=deleted_row.id, description=deleted_row.description)
+        return None
 
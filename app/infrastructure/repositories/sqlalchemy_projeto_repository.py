@@ -1,56 +1,131 @@
 import logging
-from typing import List, Optional
+from operator import attrgetter
+from typing import AsyncIterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_, or_, func
-from sqlalchemy.orm import selectinload, with_loader_criteria
-from sqlalchemy.dialects import postgresql
+from sqlalchemy import insert, update as sqlalchemy_update, delete as sqlalchemy_delete, and_, or_, func, lambda_stmt, tuple_
+from sqlalchemy.orm import selectinload, raiseload, load_only, with_loader_criteria
 from datetime import datetime, timezone
-from sqlalchemy.orm import class_mapper
 from app.domain.models.projeto_model import Projeto as DomainProjeto
 from app.application.dtos.projeto_dtos import ProjetoCreateDTO, ProjetoUpdateDTO
 from app.domain.repositories.projeto_repository import ProjetoRepository
-from app.db.orm_models import Equipe, Projeto, AlocacaoRecursoProjeto, Recurso
-from sqlalchemy.exc import SQLAlchemyError
+from app.db.orm_models import Equipe, Projeto, AlocacaoRecursoProjeto, Recurso, Secao, StatusProjeto, HorasPlanejadas
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException
+from app.core.config import settings
+from app.utils.cache import TTLCache
+from app.utils.db_errors import unique_violation_detail
+from app.utils.search_utils import contains_pattern
+
+logger = logging.getLogger("app.repositories.sqlalchemy_projeto_repository")
+
+# Colunas na ordem dos campos do modelo de domínio, usadas na listagem sem revalidação.
+_PROJETO_CAMPOS = tuple(DomainProjeto.model_fields)
+_PROJETO_COLUMNS = tuple(getattr(Projeto, campo) for campo in _PROJETO_CAMPOS)
+_projeto_attrs = attrgetter(*_PROJETO_CAMPOS)
+
+
+def _from_sql(projeto_sql: Projeto) -> DomainProjeto:
+    """Monta o DomainProjeto a partir de uma linha do banco, sem revalidar os tipos."""
+    return DomainProjeto.model_construct(**dict(zip(_PROJETO_CAMPOS, _projeto_attrs(projeto_sql))))
+
+
+def _from_row(row) -> DomainProjeto:
+    """Monta o DomainProjeto de uma linha de select(*_PROJETO_COLUMNS, ...); colunas extras no fim são ignoradas."""
+    return DomainProjeto.model_construct(**dict(zip(_PROJETO_CAMPOS, row)))
+
+# Carga do GET /projetos/detalhados: só as colunas lidas pelo ProjetoDetalhadoDTO (e as FKs
+# que os selectinload usam); equipe e timestamps não fazem parte da resposta.
+_DETALHADOS_OPTIONS = (
+    load_only(
+        Projeto.nome, Projeto.descricao, Projeto.codigo_empresa, Projeto.data_inicio_prevista,
+        Projeto.data_fim_prevista, Projeto.ativo, Projeto.secao_id, Projeto.status_projeto_id,
+    ),
+    selectinload(Projeto.secao).load_only(Secao.nome),
+    selectinload(Projeto.status).load_only(StatusProjeto.nome),
+    selectinload(Projeto.alocacoes).load_only(
+        AlocacaoRecursoProjeto.projeto_id, AlocacaoRecursoProjeto.recurso_id, AlocacaoRecursoProjeto.status_alocacao_id,
+        AlocacaoRecursoProjeto.data_inicio_alocacao, AlocacaoRecursoProjeto.data_fim_alocacao,
+    ),
+    selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.recurso).load_only(Recurso.nome),
+    selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.status_alocacao).load_only(StatusProjeto.nome),
+    selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.horas_planejadas).load_only(
+        HorasPlanejadas.alocacao_id, HorasPlanejadas.ano, HorasPlanejadas.mes, HorasPlanejadas.horas_planejadas,
+    ),
+    # Qualquer relacionamento fora da lista acima levanta erro em vez de virar N+1 silencioso
+    raiseload("*"),
+    selectinload(Projeto.alocacoes).raiseload("*"),
+)
+
+# Acima deste limit a listagem é lida em lotes via stream(), sem bufferizar todas as linhas
+_STREAM_MIN_LIMIT = 500
+_STREAM_YIELD_PER = 200
+
+# Lookups por nome/código/chave Jira (sync do Jira e webhooks). Só é consultado com
+# settings.PROJETO_LOOKUP_CACHE; create/update/delete deste repositório invalidam tudo
+# no commit da transação (que é do serviço).
+_projeto_lookup_cache = TTLCache(ttl_seconds=60, maxsize=1024)
 
 class SQLAlchemyProjetoRepository(ProjetoRepository):
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
-    
-    def _to_dict(self, obj):
-        """Converte um objeto SQLAlchemy para dicionário"""
-        if obj is None:
-            return None
-        return {c.key: getattr(obj, c.key) for c in class_mapper(obj.__class__).columns}
 
+    # O DomainProjeto só lê colunas (status_projeto_id, secao_id); nenhum relacionamento é
+    # carregado nas buscas por chave e raiseload("*") acusa qualquer acesso lazy acidental.
     async def get_by_id(self, projeto_id: int) -> Optional[DomainProjeto]:
-        result = await self.db_session.execute(select(Projeto).filter(Projeto.id == projeto_id))
-        projeto_sql = result.scalars().first()
+        # session.get consulta primeiro o identity map: releituras na mesma sessão não vão ao banco
+        projeto_sql = await self.db_session.get(Projeto, projeto_id, options=[raiseload("*")])
         if projeto_sql:
-            return DomainProjeto.model_validate(self._to_dict(projeto_sql))
+            return _from_sql(projeto_sql)
         return None
 
-    async def get_by_nome(self, nome: str) -> Optional[DomainProjeto]:
-        result = await self.db_session.execute(select(Projeto).filter(Projeto.nome == nome))
+    async def _get_by_chave(self, chave: tuple, stmt) -> Optional[DomainProjeto]:
+        """Busca por chave textual, passando pelo cache de lookups quando habilitado."""
+        if settings.PROJETO_LOOKUP_CACHE:
+            projeto = _projeto_lookup_cache.get(chave)
+            if projeto is not None:
+                # Cópia: a instância em cache é compartilhada entre requisições e não pode ser alterada
+                return projeto.model_copy()
+        result = await self.db_session.execute(stmt)
         projeto_sql = result.scalars().first()
-        if projeto_sql:
-            return DomainProjeto.model_validate(self._to_dict(projeto_sql))
-        return None
+        if not projeto_sql:
+            return None
+        projeto = _from_sql(projeto_sql)
+        if settings.PROJETO_LOOKUP_CACHE:
+            _projeto_lookup_cache.set(chave, projeto.model_copy())
+        return projeto
+
+    async def get_by_ids(self, projeto_ids: List[int]) -> List[DomainProjeto]:
+        """
+        Busca vários projetos em uma única consulta (WHERE id IN ...), em vez de N get_by_id.
+
+        Não use asyncio.gather sobre métodos deste repositório: a AsyncSession usa uma única
+        conexão e não aceita consultas concorrentes.
+        """
+        if not projeto_ids:
+            return []
+        query = select(*_PROJETO_COLUMNS).where(Projeto.id.in_(set(projeto_ids)))
+        result = await self.db_session.execute(query)
+        return [DomainProjeto.model_construct(**row) for row in result.mappings()]
+
+    # lambda_stmt: o SQL compilado fica em cache por local de código e só o parâmetro muda.
+    async def get_by_nome(self, nome: str) -> Optional[DomainProjeto]:
+        return await self._get_by_chave(
+            ("nome", nome),
+            lambda_stmt(lambda: select(Projeto).options(raiseload("*")).filter(Projeto.nome == nome)),
+        )
 
     async def get_by_codigo_empresa(self, codigo_empresa: str) -> Optional[DomainProjeto]:
-        result = await self.db_session.execute(select(Projeto).filter(Projeto.codigo_empresa == codigo_empresa))
-        projeto_sql = result.scalars().first()
-        if projeto_sql:
-            return DomainProjeto.model_validate(self._to_dict(projeto_sql))
-        return None
+        return await self._get_by_chave(
+            ("codigo_empresa", codigo_empresa),
+            lambda_stmt(lambda: select(Projeto).options(raiseload("*")).filter(Projeto.codigo_empresa == codigo_empresa)),
+        )
 
     async def get_by_jira_project_key(self, jira_project_key: str) -> Optional[DomainProjeto]:
-        result = await self.db_session.execute(select(Projeto).filter(Projeto.jira_project_key == jira_project_key))
-        projeto_sql = result.scalars().first()
-        if projeto_sql:
-            return DomainProjeto.model_validate(self._to_dict(projeto_sql))
-        return None
+        return await self._get_by_chave(
+            ("jira_project_key", jira_project_key),
+            lambda_stmt(lambda: select(Projeto).options(raiseload("*")).filter(Projeto.jira_project_key == jira_project_key)),
+        )
 
     async def create(self, projeto_data) -> DomainProjeto:
         try:
@@ -59,16 +134,64 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
                 projeto_dict = projeto_data
             else:
                 projeto_dict = projeto_data.model_dump()  # Usa model_dump() ao invés de dict()
-            novo_projeto_sql = Projeto(**projeto_dict)
-            self.db_session.add(novo_projeto_sql)
-            # Flush para gerar o ID
-            await self.db_session.flush()
-            await self.db_session.refresh(novo_projeto_sql)
+            # INSERT ... RETURNING devolve id e timestamps do banco na mesma ida, sem flush/refresh
+            query = insert(Projeto).values(**projeto_dict).returning(*_PROJETO_COLUMNS)
+            result = await self.db_session.execute(query)
+            _projeto_lookup_cache.clear_on_commit(self.db_session)
             # Não fazer commit aqui - deixar para o serviço controlar a transação
-            return DomainProjeto.model_validate(self._to_dict(novo_projeto_sql))
+            return DomainProjeto.model_construct(**result.mappings().one())
         except SQLAlchemyError as e:
             # O rollback é gerenciado pelo service layer com o `async with db_session.begin()`
-            logging.error(f"Erro ao criar projeto no repositório: {e}")
+            logger.error("Erro ao criar projeto no repositório: %s", e)
+            raise
+
+    @staticmethod
+    def _filtros_listagem(apenas_ativos: bool, status_projeto: Optional[int], search: Optional[str]) -> list:
+        """Filtros comuns a count, get_all e get_page."""
+        filtros = []
+        if search:
+            filtros.append(or_(
+                Projeto.nome.ilike(contains_pattern(search), escape="/"),
+                Projeto.codigo_empresa.ilike(contains_pattern(search), escape="/"),
+                Projeto.descricao.ilike(contains_pattern(search), escape="/")
+            ))
+        # Por padrão (apenas_ativos=True), busca apenas projetos ativos.
+        # Se apenas_ativos=False, a cláusula não é adicionada, retornando todos.
+        if apenas_ativos:
+            filtros.append(Projeto.ativo.is_(True))
+        if status_projeto is not None:
+            filtros.append(Projeto.status_projeto_id == status_projeto)
+        return filtros
+
+    async def _linhas(self, query, limit: int):
+        """
+        Linhas da listagem; páginas grandes (exportações) vêm por cursor no servidor,
+        lote a lote, sem bufferizar o resultado inteiro.
+        """
+        if limit <= _STREAM_MIN_LIMIT:
+            result = await self.db_session.execute(query)
+            for row in result:
+                yield row
+            return
+        stream = await self.db_session.stream(query.execution_options(yield_per=_STREAM_YIELD_PER))
+        async for lote in stream.partitions():
+            for row in lote:
+                yield row
+
+    async def create_many(self, projeto_create_dtos: List[ProjetoCreateDTO]) -> List[DomainProjeto]:
+        """
+        Cria vários projetos com um INSERT ... VALUES em lote (RETURNING na ordem de entrada).
+        Assim como create, não faz commit: a transação é do serviço.
+        """
+        if not projeto_create_dtos:
+            return []
+        try:
+            query = insert(Projeto).returning(*_PROJETO_COLUMNS, sort_by_parameter_order=True)
+            result = await self.db_session.execute(query, [dto.model_dump() for dto in projeto_create_dtos])
+            _projeto_lookup_cache.clear_on_commit(self.db_session)
+            return [DomainProjeto.model_construct(**row) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            logger.error("Erro ao criar projetos em lote no repositório: %s", e)
             raise
 
     async def count(self, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, **kwargs) -> int:
@@ -77,72 +200,94 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
         if "include_inactive" in kwargs and kwargs["include_inactive"] is not None:
             apenas_ativos = not kwargs["include_inactive"]
 
-        query = select(func.count()).select_from(Projeto)
-
-        if search:
-            query = query.where(or_(
-                Projeto.nome.ilike(func.concat('%', search, '%')),
-                Projeto.codigo_empresa.ilike(func.concat('%', search, '%')),
-                Projeto.descricao.ilike(func.concat('%', search, '%'))
-            ))
-        if apenas_ativos:
-            query = query.where(Projeto.ativo.is_(True))
-        if status_projeto is not None:
-            query = query.where(Projeto.status_projeto_id == status_projeto)
-
+        query = select(func.count()).select_from(Projeto).where(*self._filtros_listagem(apenas_ativos, status_projeto, search))
         result = await self.db_session.execute(query)
         return result.scalar_one()
 
-    async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, **kwargs) -> List[DomainProjeto]:
+    async def iter_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, after_nome: Optional[str] = None, after_id: Optional[int] = None, **kwargs) -> AsyncIterator[DomainProjeto]:
+        """
+        Itera os projetos da listagem ordenados por (nome, id), um a um, sem montar a lista
+        (exportações podem repassar direto para um StreamingResponse).
+
+        Com after_nome/after_id (último item da página anterior) usa paginação por cursor:
+        o índice idx_projeto_nome_id vai direto ao ponto, sem descartar `skip` linhas.
+        """
         # Compatibilidade: se a camada superior ainda enviar 'include_inactive', convertemos.
         if "include_inactive" in kwargs and kwargs["include_inactive"] is not None:
             # include_inactive=True significa queremos TODOS (apenas_ativos=False)
             apenas_ativos = not kwargs["include_inactive"]
-        logger = logging.getLogger("app.repositories.sqlalchemy_projeto_repository")
-        try:
-            query = select(Projeto).options(selectinload(Projeto.status))
+        logger.debug("Repository get_all received: search=%r, apenas_ativos=%s", search, apenas_ativos)
 
-            logger.info(f"Repository get_all received: search='{search}', apenas_ativos={apenas_ativos}")
+        query = select(*_PROJETO_COLUMNS).where(*self._filtros_listagem(apenas_ativos, status_projeto, search))
+        if after_nome is not None and after_id is not None:
+            query = query.filter(tuple_(Projeto.nome, Projeto.id) > tuple_(after_nome, after_id))
+        else:
+            query = query.offset(skip)
+        query = query.order_by(Projeto.nome, Projeto.id).limit(limit)
 
-            if search:
-                query = query.filter(or_(
-                    Projeto.nome.ilike(func.concat('%', search, '%')),
-                    Projeto.codigo_empresa.ilike(func.concat('%', search, '%')),
-                    Projeto.descricao.ilike(func.concat('%', search, '%'))
-                ))
-                logger.info(f"Applying search filter for term: '{search}'")
-
-            # Por padrão (apenas_ativos=True), busca apenas projetos ativos.
-            # Se apenas_ativos=False, a cláusula não é adicionada, retornando todos.
-            if apenas_ativos:
-                query = query.filter(Projeto.ativo.is_(True))
-
-            if status_projeto is not None:
-                query = query.filter(Projeto.status_projeto_id == status_projeto)
-            
-            query = query.order_by(Projeto.nome).offset(skip).limit(limit)
-            
-            try:
-                compiled_query = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
-                logger.info(f"Executing query: {compiled_query}")
-            except Exception as compilation_error:
-                logger.error(f"Error compiling query: {compilation_error}")
+        # Para ver o SQL executado use SQL_ECHO=true (echo do engine), sem compilar aqui
+        async for row in self._linhas(query, limit):
+            yield _from_row(row)
 
-            # Executa a consulta
-            result = await self.db_session.execute(query)
-            projetos_sql = result.scalars().all()
+    async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, after_nome: Optional[str] = None, after_id: Optional[int] = None, **kwargs) -> List[DomainProjeto]:
+        """Lista projetos ordenados por (nome, id); ver iter_all."""
+        try:
+            return [
+                projeto async for projeto in self.iter_all(
+                    skip=skip, limit=limit, apenas_ativos=apenas_ativos, status_projeto=status_projeto,
+                    search=search, after_nome=after_nome, after_id=after_id, **kwargs,
+                )
+            ]
+        except Exception:
+            logger.exception("Erro ao listar projetos")
+            raise HTTPException(status_code=500, detail="Erro ao listar projetos")
 
-            return [DomainProjeto.model_validate(self._to_dict(p)) for p in projetos_sql]
-        except Exception as e:
-            logger.error(f"Erro ao listar projetos: {str(e)}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Erro ao listar projetos: {str(e)}")
-            return None
-        except Exception as e:
-            await self.db_session.rollback()
-            error_msg = str(e)
-            # Adicionar tratamento de erro mais específico se necessário
-            logger.error(f"Erro ao atualizar projeto: {error_msg}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Erro ao atualizar projeto: {error_msg}")
+    async def get_page(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = True, status_projeto: Optional[int] = None, search: Optional[str] = None, **kwargs) -> Tuple[List[DomainProjeto], int]:
+        """
+        Página da listagem e total de projetos filtrados em uma única consulta (count(*) OVER ()),
+        no lugar de get_all + count.
+        """
+        if "include_inactive" in kwargs and kwargs["include_inactive"] is not None:
+            apenas_ativos = not kwargs["include_inactive"]
+        try:
+            query = (
+                select(*_PROJETO_COLUMNS, func.count().over())
+                .where(*self._filtros_listagem(apenas_ativos, status_projeto, search))
+                .order_by(Projeto.nome, Projeto.id)
+                .offset(skip)
+                .limit(limit)
+            )
+            projetos: List[DomainProjeto] = []
+            total = 0
+            async for row in self._linhas(query, limit):
+                total = row[-1]
+                projetos.append(_from_row(row))
+            if not projetos and skip:
+                # Página além do fim: sem linhas não há total na janela
+                total = await self.count(apenas_ativos=apenas_ativos, status_projeto=status_projeto, search=search)
+            return projetos, total
+        except Exception:
+            logger.exception("Erro ao listar projetos")
+            raise HTTPException(status_code=500, detail="Erro ao listar projetos")
+
+    async def _update_returning(self, projeto_id: int, values: dict) -> Optional[DomainProjeto]:
+        """
+        UPDATE ... RETURNING das colunas do domínio: grava e devolve a linha em uma única ida ao banco.
+        Não faz commit: a transação é do serviço.
+        """
+        query = (
+            sqlalchemy_update(Projeto)
+            .where(Projeto.id == projeto_id)
+            .values(**values)
+            .returning(*_PROJETO_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db_session.execute(query)
+        row = result.mappings().one_or_none()
+        _projeto_lookup_cache.clear_on_commit(self.db_session)
+        if row:
+            return DomainProjeto.model_construct(**row)
+        return None
 
     async def update(self, projeto_id: int, projeto_update_dto: ProjetoUpdateDTO) -> Optional[DomainProjeto]:
         """Atualiza um projeto existente."""
@@ -151,22 +296,18 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
             if not update_data:
                 return await self.get_by_id(projeto_id)
 
-            query = (
-                sqlalchemy_update(Projeto)
-                .where(Projeto.id == projeto_id)
-                .values(**update_data)
-                .returning(Projeto)
-            )
-            result = await self.db_session.execute(query)
-            await self.db_session.commit()
-            updated_sql = result.scalar_one_or_none()
-            if updated_sql:
-                return DomainProjeto.model_validate(self._to_dict(updated_sql))
-            return None
-        except Exception as e:
-            await self.db_session.rollback()
-            logger.error(f"Erro ao atualizar projeto: {str(e)}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Erro ao atualizar projeto: {str(e)}")
+            return await self._update_returning(projeto_id, update_data)
+        except IntegrityError as e:
+            # O rollback fica com a transação do serviço, que recebe a HTTPException
+            # 400 como nos demais usos de unique_violation_detail e nas pré-validações do serviço
+            detail = unique_violation_detail(e)
+            if detail is None:
+                logger.exception("Erro de integridade ao atualizar projeto %s", projeto_id)
+                detail = "Dados inválidos para o projeto"
+            raise HTTPException(status_code=400, detail=detail)
+        except SQLAlchemyError:
+            logger.exception("Erro ao atualizar projeto %s", projeto_id)
+            raise HTTPException(status_code=500, detail="Erro ao atualizar projeto")
 
     async def list_detalhados(
         self,
@@ -177,24 +318,22 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
         com_alocacoes: Optional[bool] = None,
         secao_id: Optional[int] = None,
         recurso: Optional[str] = None,
+        after_id: Optional[int] = None,
     ) -> List[Projeto]:
-        """Lista projetos com dados aninhados (alocações, horas planejadas) em única consulta."""
-        logger = logging.getLogger("app.repositories.sqlalchemy_projeto_repository")
+        """
+        Lista projetos com dados aninhados (alocações, horas planejadas) em única consulta.
+
+        Com after_id (id do último projeto da página anterior) a página começa pela PK,
+        sem OFFSET.
+        """
         try:
-            query = select(Projeto).options(
-                selectinload(Projeto.secao),
-                selectinload(Projeto.status),
-                selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.recurso),
-                selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.status_alocacao),
-                selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.horas_planejadas),
-                selectinload(Projeto.alocacoes).selectinload(AlocacaoRecursoProjeto.equipe) # Carrega a equipe associada
-            )
+            query = select(Projeto).options(*_DETALHADOS_OPTIONS)
 
             if search:
                 query = query.where(
                     or_(
-                        Projeto.nome.ilike(func.concat('%', search, '%')),
-                        Projeto.descricao.ilike(func.concat('%', search, '%')),
+                        Projeto.nome.ilike(contains_pattern(search), escape="/"),
+                        Projeto.descricao.ilike(contains_pattern(search), escape="/"),
                     )
                 )
             
@@ -219,12 +358,16 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
                     query = query.where(Projeto.alocacoes.any(recurso_filter))
                     query = query.options(with_loader_criteria(AlocacaoRecursoProjeto, recurso_filter))
 
-            query = query.order_by(Projeto.id.asc()).offset(skip).limit(limit)
+            if after_id is not None:
+                query = query.where(Projeto.id > after_id)
+            else:
+                query = query.offset(skip)
+            query = query.order_by(Projeto.id.asc()).limit(limit)
             result = await self.db_session.execute(query)
             projetos_sql = result.scalars().unique().all()
             return projetos_sql
-        except Exception as e:
-            logger.error("Erro ao listar projetos detalhados: %s", str(e), exc_info=True)
+        except Exception:
+            logger.exception("Erro ao listar projetos detalhados")
             raise HTTPException(status_code=500, detail="Erro ao listar projetos detalhados")
 
     async def count_detalhados(
@@ -242,8 +385,8 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
             if search:
                 query = query.where(
                     or_(
-                        Projeto.nome.ilike(func.concat('%', search, '%')),
-                        Projeto.descricao.ilike(func.concat('%', search, '%')),
+                        Projeto.nome.ilike(contains_pattern(search), escape="/"),
+                        Projeto.descricao.ilike(contains_pattern(search), escape="/"),
                     )
                 )
             if ativo is not None:
@@ -273,29 +416,14 @@ class SQLAlchemyProjetoRepository(ProjetoRepository):
 
             result = await self.db_session.execute(query)
             return result.scalar_one()
-        except Exception as e:
-            logging.getLogger("app.repositories.sqlalchemy_projeto_repository").error("Erro ao contar projetos detalhados: %s", str(e), exc_info=True)
+        except Exception:
+            logger.exception("Erro ao contar projetos detalhados")
             raise HTTPException(status_code=500, detail="Erro ao contar projetos detalhados")
 
     async def delete(self, projeto_id: int) -> Optional[DomainProjeto]:
         try:
-            query = (
-                sqlalchemy_update(Projeto)
-                .where(Projeto.id == projeto_id)
-                .values(ativo=False)  # data_atualizacao é gerenciada pelo DB
-                .returning(Projeto)
-            )
-            result = await self.db_session.execute(query)
-            await self.db_session.commit()
-            
-            deleted_projeto_sql = result.scalar_one_or_none()
-
-            if deleted_projeto_sql:
-                return DomainProjeto.model_validate(self._to_dict(deleted_projeto_sql))
-
-            return None
-        except Exception as e:
-            await self.db_session.rollback()
-            error_msg = str(e)
-            logger.error(f"Erro ao excluir projeto: {error_msg}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Erro ao excluir projeto: {error_msg}")
+            # data_atualizacao é gerenciada pelo DB
+            return await self._update_returning(projeto_id, {"ativo": False})
+        except SQLAlchemyError:
+            logger.exception("Erro ao excluir projeto %s", projeto_id)
+            raise HTTPException(status_code=500, detail="Erro ao excluir projeto")
@@ -1,21 +1,40 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_, or_
+from sqlalchemy import insert, update as sqlalchemy_update, delete as sqlalchemy_delete, and_, or_, lambda_stmt
 import logging
 import traceback # Adicionado para logging detalhado
-from datetime import datetime, timezone
 from app.domain.models.recurso_model import Recurso as DomainRecurso
 from app.application.dtos.recurso_dtos import RecursoCreateDTO, RecursoUpdateDTO
 from app.domain.repositories.recurso_repository import RecursoRepository
 from app.db.orm_models import Recurso
 from app.utils.dependency_checker import check_dependents
+from app.utils.cache import TTLCache
+from app.utils.search_utils import contains_pattern
+from app.core.config import settings
 from fastapi import HTTPException
 from sqlalchemy import func
 from app.db.orm_models import AlocacaoRecursoProjeto, HorasDisponiveisRH, Usuario, Apontamento
 
 logger = logging.getLogger(__name__)
 
+# Colunas na ordem dos campos do modelo de domínio, usadas na listagem sem revalidação.
+_RECURSO_COLUMNS = tuple(getattr(Recurso, campo) for campo in DomainRecurso.model_fields)
+
+# Lookups por email/matrícula/ID Jira (sync do Jira e webhooks). Só é consultado com
+# settings.RECURSO_LOOKUP_CACHE; create/update/delete deste repositório invalidam tudo
+# no commit da transação (que é do serviço).
+_recurso_lookup_cache = TTLCache(ttl_seconds=60, maxsize=1024)
+
+
+def _dados_create(recurso_create_dto: RecursoCreateDTO) -> dict:
+    """Dados de INSERT do recurso: strings vazias/"NULL" viram NULL no banco."""
+    data = recurso_create_dto.model_dump()
+    for key, value in data.items():
+        if isinstance(value, str) and (value == "" or value.upper() == "NULL"):
+            data[key] = None
+    return data
+
 
 class SQLAlchemyRecursoRepository(RecursoRepository):
     def __init__(self, db_session: AsyncSession):
@@ -31,11 +50,11 @@ class SQLAlchemyRecursoRepository(RecursoRepository):
         secao_id: Optional[int] = None
     ):
         from sqlalchemy import or_
-        query = select(Recurso)
+        query = select(*_RECURSO_COLUMNS)
         search_filter = or_(
-            Recurso.nome.ilike(f"%{search}%"),
-            Recurso.email.ilike(f"%{search}%"),
-            Recurso.matricula.ilike(f"%{search}%")
+            Recurso.nome.ilike(contains_pattern(search), escape="/"),
+            Recurso.email.ilike(contains_pattern(search), escape="/"),
+            Recurso.matricula.ilike(contains_pattern(search), escape="/")
         )
         query = query.filter(search_filter)
         if apenas_ativos:
@@ -45,40 +64,53 @@ class SQLAlchemyRecursoRepository(RecursoRepository):
         query = query.order_by(Recurso.nome.asc())
         query = query.offset(skip).limit(limit)
         result = await self.db_session.execute(query)
-        recursos_sql = result.scalars().all()
-        return [DomainRecurso.model_validate(recurso) for recurso in recursos_sql]
+        return [DomainRecurso.model_construct(**row) for row in result.mappings()]
 
+    # Buscas por chave usam lambda_stmt: o SQL compilado fica em cache e só o parâmetro muda.
     async def get_by_id(self, recurso_id: int) -> Optional[DomainRecurso]:
-        result = await self.db_session.execute(select(Recurso).filter(Recurso.id == recurso_id))
+        result = await self.db_session.execute(lambda_stmt(lambda: select(Recurso).filter(Recurso.id == recurso_id)))
         recurso_sql = result.scalars().first()
         if recurso_sql:
             return DomainRecurso.model_validate(recurso_sql)
         return None
 
-    async def get_by_email(self, email: str) -> Optional[DomainRecurso]:
-        result = await self.db_session.execute(select(Recurso).filter(Recurso.email == email))
+    async def _get_by_chave(self, chave: tuple, stmt) -> Optional[DomainRecurso]:
+        """Busca por chave textual, passando pelo cache de lookups quando habilitado."""
+        if settings.RECURSO_LOOKUP_CACHE:
+            recurso = _recurso_lookup_cache.get(chave)
+            if recurso is not None:
+                # Cópia: a instância em cache é compartilhada entre requisições e não pode ser alterada
+                return recurso.model_copy()
+        result = await self.db_session.execute(stmt)
         recurso_sql = result.scalars().first()
-        if recurso_sql:
-            return DomainRecurso.model_validate(recurso_sql)
-        return None
+        if not recurso_sql:
+            return None
+        recurso = DomainRecurso.model_validate(recurso_sql)
+        if settings.RECURSO_LOOKUP_CACHE:
+            _recurso_lookup_cache.set(chave, recurso.model_copy())
+        return recurso
+
+    async def get_by_email(self, email: str) -> Optional[DomainRecurso]:
+        return await self._get_by_chave(
+            ("email", email),
+            lambda_stmt(lambda: select(Recurso).filter(Recurso.email == email)),
+        )
 
     async def get_by_matricula(self, matricula: str) -> Optional[DomainRecurso]:
-        result = await self.db_session.execute(select(Recurso).filter(Recurso.matricula == matricula))
-        recurso_sql = result.scalars().first()
-        if recurso_sql:
-            return DomainRecurso.model_validate(recurso_sql)
-        return None
+        return await self._get_by_chave(
+            ("matricula", matricula),
+            lambda_stmt(lambda: select(Recurso).filter(Recurso.matricula == matricula)),
+        )
 
     async def get_by_jira_user_id(self, jira_user_id: str) -> Optional[DomainRecurso]:
-        result = await self.db_session.execute(select(Recurso).filter(Recurso.jira_user_id == jira_user_id))
-        recurso_sql = result.scalars().first()
-        if recurso_sql:
-            return DomainRecurso.model_validate(recurso_sql)
-        return None
+        return await self._get_by_chave(
+            ("jira_user_id", jira_user_id),
+            lambda_stmt(lambda: select(Recurso).filter(Recurso.jira_user_id == jira_user_id)),
+        )
 
     async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = False, equipe_id: Optional[int] = None, secao_id: Optional[int] = None) -> List[DomainRecurso]:
         from app.db.orm_models import Equipe
-        query = select(Recurso).filter(Recurso.equipe_principal_id.isnot(None)).order_by(Recurso.nome)
+        query = select(*_RECURSO_COLUMNS).filter(Recurso.equipe_principal_id.isnot(None)).order_by(Recurso.nome)
         if apenas_ativos:
             query = query.filter(Recurso.ativo == True)
         if equipe_id is not None:
@@ -89,8 +121,7 @@ class SQLAlchemyRecursoRepository(RecursoRepository):
         query = query.offset(skip).limit(limit)
         try:
             result = await self.db_session.execute(query)
-            recursos_sql = result.scalars().all()
-            return [DomainRecurso.model_validate(recurso) for recurso in recursos_sql]
+            return [DomainRecurso.model_construct(**row) for row in result.mappings()]
         except Exception as e:
             logger.error(f"Erro ao executar query no get_all: {e}")
             traceback.print_exc()
@@ -98,52 +129,67 @@ class SQLAlchemyRecursoRepository(RecursoRepository):
 
     async def create(self, recurso_create_dto: RecursoCreateDTO) -> DomainRecurso:
         try:
-            # Converter strings vazias para None (NULL no banco)
-            data = recurso_create_dto.model_dump()
-            for key, value in data.items():
-                if isinstance(value, str) and (value == "" or value.upper() == "NULL"):
-                    data[key] = None
-                    
-            now_naive = datetime.now().replace(microsecond=0, tzinfo=None)
-            new_recurso_sql = Recurso(
-                **data,
-                data_criacao=now_naive,
-                data_atualizacao=now_naive,
-                ativo=True
-            )
-            self.db_session.add(new_recurso_sql)
-            await self.db_session.commit()
-            await self.db_session.refresh(new_recurso_sql)
-            
-            return DomainRecurso.model_validate(new_recurso_sql)
+            # data_criacao/data_atualizacao vêm do DEFAULT now() do banco e ativo do default da coluna;
+            # o RETURNING devolve a linha completa sem o SELECT do refresh. Sem commit: a transação é do serviço
+            query = insert(Recurso).values(**_dados_create(recurso_create_dto)).returning(*_RECURSO_COLUMNS)
+            result = await self.db_session.execute(query)
+            _recurso_lookup_cache.clear_on_commit(self.db_session)
+            return DomainRecurso.model_construct(**result.mappings().one())
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Error creating recurso: {e}")
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=f"Erro ao criar recurso: {str(e)}")
 
-    async def update(self, recurso_id: int, recurso_update_dto: RecursoUpdateDTO) -> Optional[DomainRecurso]:
+    async def create_many(self, recurso_create_dtos: List[RecursoCreateDTO]) -> List[DomainRecurso]:
+        """
+        Cria vários recursos com um INSERT ... VALUES em lote (RETURNING na ordem de entrada).
+        Assim como create, não faz commit: a transação é do serviço.
+        """
+        if not recurso_create_dtos:
+            return []
         try:
-            recurso_sql = await self.db_session.get(Recurso, recurso_id)
-            if not recurso_sql:
-                return None
+            query = insert(Recurso).returning(*_RECURSO_COLUMNS, sort_by_parameter_order=True)
+            result = await self.db_session.execute(
+                query, [_dados_create(dto) for dto in recurso_create_dtos]
+            )
+            _recurso_lookup_cache.clear_on_commit(self.db_session)
+            return [DomainRecurso.model_construct(**row) for row in result.mappings()]
+        except Exception as e:
+            logger.error(f"Error creating recursos: {e}")
+            raise HTTPException(status_code=500, detail="Erro ao criar recursos")
 
+    async def _update_returning(self, recurso_id: int, values: dict) -> Optional[DomainRecurso]:
+        """
+        UPDATE ... RETURNING das colunas do domínio: grava e devolve a linha em uma única ida ao banco.
+        Não faz commit: a transação é do serviço.
+        """
+        query = (
+            sqlalchemy_update(Recurso)
+            .where(Recurso.id == recurso_id)
+            .values(**values)
+            .returning(*_RECURSO_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db_session.execute(query)
+        row = result.mappings().one_or_none()
+        _recurso_lookup_cache.clear_on_commit(self.db_session)
+        if row:
+            return DomainRecurso.model_construct(**row)
+        return None
+
+    async def update(self, recurso_id: int, recurso_update_dto: RecursoUpdateDTO) -> Optional[DomainRecurso]:
+        try:
             # Converter strings vazias para None (NULL no banco)
             update_data = recurso_update_dto.model_dump(exclude_unset=True)
             for key, value in update_data.items():
                 if isinstance(value, str) and (value == "" or value.upper() == "NULL"):
                     update_data[key] = None
-            
-            # Atualizar os campos
-            for key, value in update_data.items():
-                setattr(recurso_sql, key, value)
-            
-            recurso_sql.data_atualizacao = datetime.now().replace(microsecond=0, tzinfo=None)
-            await self.db_session.commit()
-            await self.db_session.refresh(recurso_sql)
-            return DomainRecurso.model_validate(recurso_sql)
+            if not update_data:
+                return await self.get_by_id(recurso_id)
+
+            # data_atualizacao é gerenciada pelo DB (trigger tg_set_data_atualizacao)
+            return await self._update_returning(recurso_id, update_data)
         except Exception as e:
-            await self.db_session.rollback()
             logger.error(f"Error updating recurso: {e}")
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=f"Erro ao atualizar recurso: {str(e)}")
@@ -199,24 +245,13 @@ class SQLAlchemyRecursoRepository(RecursoRepository):
                     detail=f"Não é possível excluir pois existem apontamentos vinculados."
                 )
 
-            # Buscar o recurso
-            recurso_to_delete_sql = await self.db_session.get(Recurso, recurso_id)
-            if not recurso_to_delete_sql:
-                return None
-
             # Inativar o recurso em vez de deletar
-            recurso_to_delete_sql.ativo = False
-            recurso_to_delete_sql.data_atualizacao = datetime.now().replace(microsecond=0, tzinfo=None)
-            await self.db_session.commit()
-            await self.db_session.refresh(recurso_to_delete_sql)
-            
-            return DomainRecurso.model_validate(recurso_to_delete_sql)
+            return await self._update_returning(recurso_id, {"ativo": False})
         except HTTPException as e:
             # Propagar exceções HTTP (como 409 Conflict) para o service/rota
             raise e
         except Exception as e:
-            # Logar e tratar outros erros
-            await self.db_session.rollback()
+            # Logar e tratar outros erros; o rollback fica com a transação do serviço
             logger.error(f"Error deleting recurso: {e}")
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=f"Erro ao deletar recurso: {str(e)}")
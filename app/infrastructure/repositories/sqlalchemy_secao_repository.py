@@ -1,7 +1,7 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_
+from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_, lambda_stmt
 from app.utils.dependency_checker import check_dependents
 from app.domain.models.secao_model import Secao as DomainSecao
 from app.application.dtos.secao_dtos import SecaoCreateDTO, SecaoUpdateDTO
@@ -13,40 +13,40 @@ from app.infrastructure.database.equipe_sql_model import EquipeSQL
 from app.infrastructure.database.recurso_sql_model import RecursoSQL
 # ... demais imports
 
+# Colunas na ordem dos campos do modelo de domínio, usadas na listagem sem revalidação.
+_SECAO_COLUMNS = tuple(getattr(SecaoSQL, campo) for campo in DomainSecao.model_fields)
+
 class SQLAlchemySecaoRepository(SecaoRepository):
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
     async def get_by_id(self, secao_id: int) -> Optional[DomainSecao]:
-        result = await self.db_session.execute(select(SecaoSQL).filter(SecaoSQL.id == secao_id))
+        result = await self.db_session.execute(lambda_stmt(lambda: select(SecaoSQL).filter(SecaoSQL.id == secao_id)))
         secao_sql = result.scalars().first()
         if secao_sql:
             return DomainSecao.model_validate(secao_sql) # Pydantic V2
         return None
 
     async def get_by_nome(self, nome: str) -> Optional[DomainSecao]:
-        result = await self.db_session.execute(select(SecaoSQL).filter(SecaoSQL.nome == nome))
+        result = await self.db_session.execute(lambda_stmt(lambda: select(SecaoSQL).filter(SecaoSQL.nome == nome)))
         secao_sql = result.scalars().first()
         if secao_sql:
             return DomainSecao.model_validate(secao_sql)
         return None
 
     async def get_all(self, skip: int = 0, limit: int = 100, apenas_ativos: bool = False) -> List[DomainSecao]:
-        query = select(SecaoSQL)
+        query = select(*_SECAO_COLUMNS)
         if apenas_ativos:
             query = query.filter(SecaoSQL.ativo == True)
         query = query.offset(skip).limit(limit)
         result = await self.db_session.execute(query)
-        secoes_sql = result.scalars().all()
-        return [DomainSecao.model_validate(secao) for secao in secoes_sql]
+        return [DomainSecao.model_construct(**row) for row in result.mappings()]
 
     async def create(self, secao_create_dto: SecaoCreateDTO) -> DomainSecao:
-        agora = datetime.now(timezone.utc)
+        # data_criacao/data_atualizacao vêm do DEFAULT now() do banco
         new_secao_sql = SecaoSQL(
             nome=secao_create_dto.nome,
             descricao=secao_create_dto.descricao,
-            data_criacao=agora,
-            data_atualizacao=agora,
             ativo=True
         )
         self.db_session.add(new_secao_sql)
@@ -1,8 +1,9 @@
 import logging
+from operator import attrgetter
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, func
+from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, func, lambda_stmt
 from datetime import datetime, timezone
 from sqlalchemy.orm import class_mapper
 from fastapi import HTTPException
@@ -11,9 +12,23 @@ from app.application.dtos.status_projeto_dtos import StatusProjetoCreateDTO, Sta
 from app.domain.repositories.status_projeto_repository import StatusProjetoRepository
 from app.infrastructure.database.status_projeto_sql_model import StatusProjetoSQL
 from app.utils.dependency_checker import check_dependents
+from app.utils.cache import TTLCache
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Colunas na ordem dos campos do modelo de domínio, usadas na listagem sem revalidação.
+_STATUS_PROJETO_COLUMNS = tuple(getattr(StatusProjetoSQL, campo) for campo in DomainStatusProjeto.model_fields)
+
+# Chaves das colunas e getter em C montados uma vez; _to_dict não percorre o mapper a cada objeto.
+_STATUS_PROJETO_SQL_CAMPOS = tuple(c.key for c in class_mapper(StatusProjetoSQL, configure=False).columns)
+_status_projeto_sql_attrs = attrgetter(*_STATUS_PROJETO_SQL_CAMPOS)
+
+# Listagens de status mudam raramente e são lidas em quase toda tela. Só é consultado com
+# settings.STATUS_PROJETO_CACHE; guarda a lista completa e ordenada por filtro de `ativo`
+# (no máximo 3 entradas) e skip/limit são aplicados sobre ela. Invalidado nas escritas.
+_status_projeto_cache = TTLCache(ttl_seconds=300, maxsize=3)
+
 
 class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
     def __init__(self, db_session: AsyncSession):
@@ -23,11 +38,11 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
         """Converte um objeto SQLAlchemy para dicionário"""
         if obj is None:
             return None
-        return {c.key: getattr(obj, c.key) for c in class_mapper(obj.__class__).columns}
+        return dict(zip(_STATUS_PROJETO_SQL_CAMPOS, _status_projeto_sql_attrs(obj)))
 
     async def get_by_id(self, status_id: int) -> Optional[DomainStatusProjeto]:
         try:
-            result = await self.db_session.execute(select(StatusProjetoSQL).filter(StatusProjetoSQL.id == status_id, StatusProjetoSQL.ativo == True))
+            result = await self.db_session.execute(lambda_stmt(lambda: select(StatusProjetoSQL).filter(StatusProjetoSQL.id == status_id, StatusProjetoSQL.ativo == True)))
             status_sql = result.scalars().first()
             if status_sql:
                 return DomainStatusProjeto.model_validate(self._to_dict(status_sql))
@@ -42,7 +57,7 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
 
     async def get_by_nome(self, nome: str) -> Optional[DomainStatusProjeto]:
         try:
-            result = await self.db_session.execute(select(StatusProjetoSQL).filter(StatusProjetoSQL.nome == nome, StatusProjetoSQL.ativo == True))
+            result = await self.db_session.execute(lambda_stmt(lambda: select(StatusProjetoSQL).filter(StatusProjetoSQL.nome == nome, StatusProjetoSQL.ativo == True)))
             status_sql = result.scalars().first()
             if status_sql:
                 return DomainStatusProjeto.model_validate(self._to_dict(status_sql))
@@ -57,15 +72,23 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
 
     async def get_all(self, skip: int = 0, limit: int = 100, ativo: Optional[bool] = None) -> List[DomainStatusProjeto]:
         try:
-            query = select(StatusProjetoSQL)
+            query = select(*_STATUS_PROJETO_COLUMNS)
 
             if ativo is not None:
                 query = query.filter(StatusProjetoSQL.ativo == ativo)
 
-            query = query.order_by(StatusProjetoSQL.ordem_exibicao, StatusProjetoSQL.nome).offset(skip).limit(limit)
-            result = await self.db_session.execute(query)
-            status_sql = result.scalars().all()
-            return [DomainStatusProjeto.model_validate(self._to_dict(s)) for s in status_sql]
+            query = query.order_by(StatusProjetoSQL.ordem_exibicao, StatusProjetoSQL.nome)
+            if not settings.STATUS_PROJETO_CACHE:
+                result = await self.db_session.execute(query.offset(skip).limit(limit))
+                return [DomainStatusProjeto.model_construct(**row) for row in result.mappings()]
+
+            status_list = _status_projeto_cache.get(ativo)
+            if status_list is None:
+                result = await self.db_session.execute(query)
+                status_list = [DomainStatusProjeto.model_construct(**row) for row in result.mappings()]
+                _status_projeto_cache.set(ativo, status_list)
+            # Cópias: as instâncias em cache são compartilhadas entre requisições
+            return [status.model_copy() for status in status_list[skip:skip + limit]]
         except Exception as e:
             # Log the error
             logger.error(f"Erro ao listar status: {str(e)}")
@@ -76,14 +99,11 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
 
     async def create(self, status_create_dto: StatusProjetoCreateDTO) -> DomainStatusProjeto:
         try:
-            agora = datetime.now(timezone.utc)
-            new_status_sql = StatusProjetoSQL(
-                **status_create_dto.model_dump(),
-                data_criacao=agora,
-                data_atualizacao=agora
-            )
+            # data_criacao/data_atualizacao vêm do DEFAULT now() do banco
+            new_status_sql = StatusProjetoSQL(**status_create_dto.model_dump())
             self.db_session.add(new_status_sql)
             await self.db_session.commit()
+            _status_projeto_cache.clear()
             await self.db_session.refresh(new_status_sql)
             return DomainStatusProjeto.model_validate(self._to_dict(new_status_sql))
         except HTTPException as e:
@@ -144,6 +164,7 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
                 setattr(status_sql, key, value)
                 
             await self.db_session.commit()
+            _status_projeto_cache.clear()
             await self.db_session.refresh(status_sql)
             
             # Converter para dicionário antes de validar
@@ -230,6 +251,7 @@ class SQLAlchemyStatusProjetoRepository(StatusProjetoRepository):
             status_sql.data_atualizacao = datetime.now(timezone.utc)
 
             await self.db_session.commit()
+            _status_projeto_cache.clear()
             await self.db_session.refresh(status_sql)
 
             return DomainStatusProjeto.model_validate(self._to_dict(status_sql))
@@ -2,7 +2,7 @@ import uvicorn
 import logging
 import sys
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.docs import custom_openapi
@@ -28,6 +28,7 @@ logger.info("LOGGING FORÇADO ATIVADO. APLICAÇÃO INICIANDO...")
 
 # Configuração para SQLAlchemy assíncrono
 from sqlalchemy.ext.asyncio import async_scoped_session, AsyncSession
+from sqlalchemy.orm import configure_mappers
 
 # Criar aplicação FastAPI
 app = FastAPI(
@@ -36,6 +37,7 @@ app = FastAPI(
     description="API para o Sistema de Gestão de Projetos e Melhorias",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson serializa datetime/date nativamente
 )
 
 # Adicionar middleware CORS
@@ -61,6 +63,10 @@ app.include_router(api_router, prefix="/backend") # Rotas legadas
 app.include_router(v1_router, prefix="/backend/v1") # Novas rotas da V1
 app.include_router(health.router, prefix="/health")
 
+# Resolve todos os relationship() agora (modelos já importados pelos routers): um alvo
+# inexistente derruba o boot em vez de estourar na primeira requisição que usar o mapper.
+configure_mappers()
+
 @app.get("/")
 def root():
     """Redireciona para a documentação da API."""
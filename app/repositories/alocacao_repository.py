@@ -1,11 +1,14 @@
+import logging
 from typing import List, Optional, Dict, Any
 from datetime import date
 from sqlalchemy import select, or_, update, func
-from sqlalchemy.orm import noload, joinedload
+from sqlalchemy.orm import noload, joinedload, raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.orm_models import AlocacaoRecursoProjeto, Recurso, Projeto
+from app.db.orm_models import AlocacaoRecursoProjeto, Recurso, Projeto, periodo_alocacao
 from app.repositories.base_repository import BaseRepository
 
+logger = logging.getLogger(__name__)
+
 class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
 
 
@@ -29,7 +32,8 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             joinedload(AlocacaoRecursoProjeto.equipe),
             joinedload(AlocacaoRecursoProjeto.recurso),
             joinedload(AlocacaoRecursoProjeto.projeto),
-            joinedload(AlocacaoRecursoProjeto.status_alocacao)
+            joinedload(AlocacaoRecursoProjeto.status_alocacao),
+            raiseload("*")  # demais relacionamentos (ex.: horas_planejadas) não podem gerar N+1
         )
         if apenas_ativos:
             query = query.filter(or_(
@@ -61,14 +65,11 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             .returning(self.model)
         )
         result = await self.db.execute(query)
-        await self.db.flush()
         await self.db.commit()
         return result.scalars().first()
     
     async def get_by_recurso_projeto_data(self, recurso_id: int, projeto_id: int, data_inicio: date) -> Optional[AlocacaoRecursoProjeto]:
         """Obtém alocação pelo recurso, projeto e data de início."""
-        import logging
-        logger = logging.getLogger(__name__)
         
         logger.info(f"[GET_BY_RECURSO_PROJETO_DATA] Buscando: recurso_id={recurso_id}, projeto_id={projeto_id}, data_inicio={data_inicio}")
         
@@ -91,12 +92,15 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
         self, recurso_id: int, data_inicio: date, data_fim: date, exclude_alocacao_id: Optional[int] = None
     ) -> List[AlocacaoRecursoProjeto]:
         """Encontra alocações para um recurso que se sobrepõem a um determinado período."""
-        import logging
-        logger = logging.getLogger(__name__)
         
         logger.info(f"[FIND_OVERLAPPING] Iniciando busca por conflitos - recurso_id: {recurso_id}, periodo: {data_inicio} - {data_fim}")
         logger.info(f"[FIND_OVERLAPPING] Buscando alocações que se sobrepõem ao período solicitado")
         logger.info(f"[FIND_OVERLAPPING] Lógica: nova_inicio <= existente_fim E nova_fim >= existente_inicio")
+
+        # daterange(inicio, fim) com inicio > fim é erro no PostgreSQL; período invertido não sobrepõe nada
+        if data_fim is not None and data_inicio > data_fim:
+            logger.info(f"[FIND_OVERLAPPING] Período invertido, nenhum conflito")
+            return []
         
         try:
             # Carregar explicitamente o relacionamento projeto para evitar lazy loading
@@ -107,13 +111,10 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
                 joinedload(self.model.projeto)
             ).filter(
                 self.model.recurso_id == recurso_id,
-                # Condição 1: A nova começa antes que a existente termine (ou a existente não tem fim)
-                or_(
-                    self.model.data_fim_alocacao == None,  # Alocação existente sem fim
-                    data_inicio <= self.model.data_fim_alocacao  # Nova começa antes do fim da existente
-                ),
-                # Condição 2: A nova termina depois que a existente comece
-                data_fim >= self.model.data_inicio_alocacao
+                # Operador && de daterange (índice GiST); fim NULL = alocação sem fim
+                periodo_alocacao(self.model.data_inicio_alocacao, self.model.data_fim_alocacao).op("&&")(
+                    periodo_alocacao(data_inicio, data_fim)
+                )
             )
 
             if exclude_alocacao_id is not None:
@@ -139,7 +140,8 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             joinedload(AlocacaoRecursoProjeto.equipe),
             joinedload(AlocacaoRecursoProjeto.recurso),
             joinedload(AlocacaoRecursoProjeto.projeto),
-            joinedload(AlocacaoRecursoProjeto.status_alocacao)
+            joinedload(AlocacaoRecursoProjeto.status_alocacao),
+            raiseload("*")  # demais relacionamentos (ex.: horas_planejadas) não podem gerar N+1
         ).filter(
             AlocacaoRecursoProjeto.recurso_id == recurso_id
         )
@@ -152,7 +154,8 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             joinedload(AlocacaoRecursoProjeto.equipe),
             joinedload(AlocacaoRecursoProjeto.recurso),
             joinedload(AlocacaoRecursoProjeto.projeto),
-            joinedload(AlocacaoRecursoProjeto.status_alocacao)
+            joinedload(AlocacaoRecursoProjeto.status_alocacao),
+            raiseload("*")  # demais relacionamentos (ex.: horas_planejadas) não podem gerar N+1
         ).filter(
             AlocacaoRecursoProjeto.projeto_id == projeto_id
         )
@@ -168,31 +171,21 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             joinedload(AlocacaoRecursoProjeto.equipe),
             joinedload(AlocacaoRecursoProjeto.recurso),
             joinedload(AlocacaoRecursoProjeto.projeto),
-            joinedload(AlocacaoRecursoProjeto.status_alocacao)
+            joinedload(AlocacaoRecursoProjeto.status_alocacao),
+            raiseload("*")  # demais relacionamentos (ex.: horas_planejadas) não podem gerar N+1
         )
         
         if data_inicio is not None and data_fim is not None:
+            # daterange(inicio, fim) com inicio > fim é erro no PostgreSQL: período vazio
+            if data_inicio > data_fim:
+                return []
+            # Os três casos (atravessa, começa ou termina no período) são exatamente a
+            # sobreposição de intervalos: operador && de daterange, atendido pelo índice GiST
             query = query.filter(
-                or_(
-                    # Começou antes e terminou depois (ou não terminou)
-                    and_(
-                        AlocacaoRecursoProjeto.data_inicio_alocacao <= data_fim,
-                        or_(
-                            AlocacaoRecursoProjeto.data_fim_alocacao == None,
-                            AlocacaoRecursoProjeto.data_fim_alocacao >= data_inicio
-                        )
-                    ),
-                    # Começou durante o período
-                    and_(
-                        AlocacaoRecursoProjeto.data_inicio_alocacao >= data_inicio,
-                        AlocacaoRecursoProjeto.data_inicio_alocacao <= data_fim
-                    ),
-                    # Terminou durante o período
-                    and_(
-                        AlocacaoRecursoProjeto.data_fim_alocacao >= data_inicio,
-                        AlocacaoRecursoProjeto.data_fim_alocacao <= data_fim
-                    )
-                )
+                periodo_alocacao(
+                    AlocacaoRecursoProjeto.data_inicio_alocacao,
+                    AlocacaoRecursoProjeto.data_fim_alocacao
+                ).op("&&")(periodo_alocacao(data_inicio, data_fim))
             )
         elif data_inicio is not None:
             query = query.filter(
@@ -218,7 +211,8 @@ class AlocacaoRepository(BaseRepository[AlocacaoRecursoProjeto]):
             joinedload(AlocacaoRecursoProjeto.equipe),
             joinedload(AlocacaoRecursoProjeto.recurso),
             joinedload(AlocacaoRecursoProjeto.projeto),
-            joinedload(AlocacaoRecursoProjeto.status_alocacao)
+            joinedload(AlocacaoRecursoProjeto.status_alocacao),
+            raiseload("*")  # demais relacionamentos (ex.: horas_planejadas) não podem gerar N+1
         ).filter(
             or_(
                 AlocacaoRecursoProjeto.data_fim_alocacao == None,
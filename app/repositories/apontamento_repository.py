@@ -1,9 +1,12 @@
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
 from sqlalchemy import func, extract, and_, or_, text, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload
 from app.db.orm_models import Apontamento, Recurso, Projeto, Equipe, Secao, FonteApontamento, equipe_projeto_association
+from app.utils.search_utils import contains_pattern
 from app.repositories.base_repository import BaseRepository
 import logging
 import calendar
@@ -81,9 +84,54 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
             
         return await self.delete(id)
     
+    def preparar_dados_jira(self, data: Dict[str, Any], log_prefix: str) -> Dict[str, Any]:
+        """
+        Normaliza os dados de um worklog do Jira e valida os campos obrigatórios.
+        Levanta ValueError para worklogs que o banco rejeitaria, antes de irem para o lote.
+        """
+        # Remover timezone de todos os campos datetime (se houver)
+        for campo in ["data_hora_inicio_trabalho", "data_criacao", "data_atualizacao", "data_sincronizacao_jira"]:
+            valor = data.get(campo)
+            if isinstance(valor, datetime) and valor.tzinfo is not None:
+                data[campo] = valor.replace(tzinfo=None)
+        
+        # Garantir que fonte_apontamento seja do tipo correto (enum)
+        data["fonte_apontamento"] = FonteApontamento.JIRA
+        
+        # Verificar se temos todos os campos obrigatórios
+        campos_obrigatorios = [
+            "jira_worklog_id", "recurso_id", "projeto_id", "data_apontamento",
+            "horas_apontadas", "data_criacao", "data_atualizacao"
+        ]
+        for campo in campos_obrigatorios:
+            if data.get(campo) is None:
+                logger.error(f"[{log_prefix}] Campo obrigatório ausente: {campo}")
+                raise ValueError(f"Campo obrigatório ausente: {campo}")
+        
+        # A coluna é NUMERIC(5,2): arredonda como o banco e aplica chk_apontamento_horas
+        # (worklogs de poucos segundos arredondam para 0.00)
+        horas = float(Decimal(str(data["horas_apontadas"])).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+        if horas <= 0 or horas > 24:
+            logger.error(f"[{log_prefix}] Horas inválidas para o worklog {data['jira_worklog_id']}: {horas}")
+            raise ValueError(f"Horas inválidas: {horas}")
+        data["horas_apontadas"] = horas
+        return data
+    
+    def _upsert_jira_stmt(self, rows: List[Dict[str, Any]]):
+        """
+        INSERT ... ON CONFLICT (jira_worklog_id) DO UPDATE para os worklogs informados.
+        O alvo do conflito repete o predicado do índice parcial ux_apontamento_jira_worklog_id.
+        """
+        stmt = pg_insert(Apontamento).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[Apontamento.jira_worklog_id],
+            index_where=Apontamento.jira_worklog_id.isnot(None),
+            set_={campo: stmt.excluded[campo] for campo in rows[0] if campo != "jira_worklog_id"},
+        )
+    
     async def sync_jira_apontamento(self, jira_worklog_id: str, data: Dict[str, Any]) -> Apontamento:
         """
-        Cria ou atualiza um apontamento a partir de dados do Jira.
+        Cria ou atualiza um apontamento a partir de dados do Jira (um único upsert).
         
         Args:
             jira_worklog_id: ID do worklog no Jira
@@ -98,67 +146,64 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
         data["jira_worklog_id"] = jira_worklog_id
         
         try:
-            # Verificar se o apontamento já existe
-            query = select(Apontamento).where(Apontamento.jira_worklog_id == jira_worklog_id)
-            result = await self.db.execute(query)
-            apontamento = result.scalars().first()
-            
-            # Remover timezone de todos os campos datetime (se houver)
-            for campo in ["data_hora_inicio_trabalho", "data_criacao", "data_atualizacao", "data_sincronizacao_jira"]:
-                valor = data.get(campo)
-                if isinstance(valor, datetime) and valor.tzinfo is not None:
-                    data[campo] = valor.replace(tzinfo=None)
+            self.preparar_dados_jira(data, "SYNC_APONTAMENTO")
             
-            # Garantir que fonte_apontamento seja do tipo correto (enum)
-            data["fonte_apontamento"] = FonteApontamento.JIRA
-            
-            # Verificar se temos todos os campos obrigatórios
-            campos_obrigatorios = [
-                "recurso_id", "projeto_id", "data_apontamento", 
-                "horas_apontadas", "data_criacao", "data_atualizacao"
-            ]
-            
-            # Campos opcionais de hierarquia Jira (novos campos)
-            campos_hierarquia = [
-                "jira_parent_key", "jira_issue_type", "nome_subtarefa", 
-                "projeto_pai_id", "nome_projeto_pai"
-            ]
-            
-            # Log dos campos de hierarquia recebidos
-            for campo in campos_hierarquia:
-                if campo in data:
-                    logger.info(f"[SYNC_APONTAMENTO] Campo hierarquia {campo}: {data[campo]}")
-            
-            for campo in campos_obrigatorios:
-                if campo not in data or data[campo] is None:
-                    logger.error(f"[SYNC_APONTAMENTO] Campo obrigatório ausente: {campo}")
-                    raise ValueError(f"Campo obrigatório ausente: {campo}")
-            
-            if apontamento:
-                logger.info(f"[SYNC_APONTAMENTO] Atualizando apontamento existente id={apontamento.id}")
-                # Atualiza o apontamento existente
-                for key, value in data.items():
-                    setattr(apontamento, key, value)
-                    
-                await self.db.commit()
-                await self.db.refresh(apontamento)
-                logger.info(f"[SYNC_APONTAMENTO] Apontamento atualizado com sucesso id={apontamento.id}")
-                return apontamento
-            else:
-                logger.info(f"[SYNC_APONTAMENTO] Criando novo apontamento para worklog_id={jira_worklog_id}")
-                # Cria um novo apontamento
-                apontamento = self.model(**data)
-                self.db.add(apontamento)
-                await self.db.commit()
-                await self.db.refresh(apontamento)
-                logger.info(f"[SYNC_APONTAMENTO] Apontamento criado com sucesso id={apontamento.id}")
-                return apontamento
+            stmt = self._upsert_jira_stmt([data]).returning(Apontamento)
+            result = await self.db.execute(
+                select(Apontamento).from_statement(stmt).execution_options(populate_existing=True)
+            )
+            apontamento = result.scalars().one()
+            await self.db.commit()
+            logger.info(f"[SYNC_APONTAMENTO] Apontamento sincronizado com sucesso id={apontamento.id}")
+            return apontamento
                 
         except Exception as e:
             logger.error(f"[SYNC_APONTAMENTO] Erro ao sincronizar apontamento: {str(e)}")
             await self.db.rollback()
             raise
     
+    async def sync_jira_apontamentos(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Cria ou atualiza em lote apontamentos vindos do Jira: um único
+        INSERT ... ON CONFLICT DO UPDATE e um commit. Se o lote falhar, grava
+        linha a linha e descarta só os worklogs rejeitados.
+        
+        Args:
+            rows: Dados dos apontamentos já passados por preparar_dados_jira
+            
+        Returns:
+            Quantidade de worklogs gravados (worklogs repetidos contam uma vez)
+        """
+        if not rows:
+            return 0
+        
+        # O mesmo worklog não pode aparecer duas vezes no mesmo ON CONFLICT; o último prevalece
+        por_worklog: Dict[str, Dict[str, Any]] = {}
+        for data in rows:
+            por_worklog[data["jira_worklog_id"]] = data
+        dados = list(por_worklog.values())
+        
+        try:
+            # Lotes de 1000 linhas mantêm o INSERT abaixo do limite de 32767 parâmetros do PostgreSQL
+            for inicio in range(0, len(dados), 1000):
+                await self.db.execute(self._upsert_jira_stmt(dados[inicio:inicio + 1000]))
+            await self.db.commit()
+            logger.info(f"[SYNC_APONTAMENTO_LOTE] {len(dados)} worklogs sincronizados")
+            return len(dados)
+        except Exception as e:
+            logger.warning(f"[SYNC_APONTAMENTO_LOTE] Lote rejeitado, gravando linha a linha: {str(e)}")
+            await self.db.rollback()
+        
+        gravados = 0
+        for data in dados:
+            try:
+                await self.sync_jira_apontamento(data["jira_worklog_id"], data)
+                gravados += 1
+            except Exception as e:
+                # sync_jira_apontamento já fez rollback; segue para o próximo worklog
+                logger.error(f"[SYNC_APONTAMENTO_LOTE] Worklog {data['jira_worklog_id']} ignorado: {str(e)}")
+        return gravados
+    
     async def delete_from_jira(self, jira_worklog_id: str) -> bool:
         """
         Remove um apontamento com base no ID do worklog do Jira.
@@ -193,7 +238,8 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
                         limit: int = 100
                        ) -> List[Apontamento]:
         """Busca apontamentos com filtros avançados."""
-        query = select(Apontamento)
+        # A resposta só usa colunas; qualquer acesso a relacionamento levantaria N+1
+        query = select(Apontamento).options(raiseload("*"))
         
         # Aplicar filtros diretos
         if recurso_id:
@@ -212,7 +258,7 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
             query = query.filter(Apontamento.fonte_apontamento == fonte_apontamento)
         
         if jira_issue_key:
-            query = query.filter(Apontamento.jira_issue_key.ilike(f"%{jira_issue_key}%"))
+            query = query.filter(Apontamento.jira_issue_key.ilike(contains_pattern(jira_issue_key), escape="/"))
         
         # Filtros relacionais (equipe e seção)
         if equipe_id or secao_id:
@@ -264,12 +310,6 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
         """
         query = select(self.model)
         
-        # joinedload para agrupamento
-        if agrupar_por_recurso:
-            query = query.options(joinedload(self.model.recurso))
-        if agrupar_por_projeto:
-            query = query.options(joinedload(self.model.projeto))
-        
         # Flags para controlar se join já foi feito
         recurso_joined = False
         equipe_joined = False
@@ -314,22 +354,16 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
             query = query.filter(self.model.jira_issue_key == jira_issue_key)
             
         try:
-            result = await self.db.execute(query)
-            apontamentos = result.scalars().all()
-            
-            # Se não há apontamentos, retornar estrutura vazia
-            if not apontamentos:
-                return {
-                    "items": [],
-                    "total": 0,
-                    "total_horas": 0
-                }
-            
             # Se não há opções de agrupamento, retorna os apontamentos diretamente
             if not any([agrupar_por_recurso, agrupar_por_projeto, agrupar_por_data, agrupar_por_mes]):
+                # O período pode cobrir anos de apontamentos: as linhas são lidas em lotes
+                # por um cursor no servidor e cada lote de objetos ORM é liberado após virar dict.
+                # A resposta em si continua inteira em memória (lista de dicts, O(linhas)).
+                result = await self.db.stream(query.execution_options(yield_per=1000))
+                
                 # Converter apontamentos para dicionários para evitar problemas de serialização
                 apontamentos_dict = []
-                for a in apontamentos:
+                async for a in result.scalars():
                     apontamento_dict = {
                         "id": a.id,
                         "recurso_id": a.recurso_id,
@@ -347,76 +381,35 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
                     "total_horas": sum(a["horas_apontadas"] for a in apontamentos_dict)
                 }
             
-            # Processar agrupamentos
-            resultado_agrupado = []
+            # Agrupamento feito no banco (GROUP BY): só as linhas agregadas voltam para o Python
+            colunas_grupo = []
+            if agrupar_por_recurso:
+                if not recurso_joined:
+                    query = query.join(Recurso, self.model.recurso_id == Recurso.id)
+                colunas_grupo += [self.model.recurso_id.label("recurso_id"), Recurso.nome.label("recurso_nome")]
+            if agrupar_por_projeto:
+                if not projeto_joined:
+                    query = query.join(Projeto, self.model.projeto_id == Projeto.id)
+                colunas_grupo += [self.model.projeto_id.label("projeto_id"), Projeto.nome.label("projeto_nome")]
+            if agrupar_por_data:
+                colunas_grupo.append(self.model.data_apontamento.label("data"))
+            elif agrupar_por_mes:
+                colunas_grupo += [
+                    extract("year", self.model.data_apontamento).label("ano"),
+                    extract("month", self.model.data_apontamento).label("mes"),
+                ]
             
-            # Agrupar apontamentos
-            grupos = {}
-            for apontamento in apontamentos:
-                try:
-                    # Definir a chave de agrupamento
-                    key_parts = []
-                    
-                    if agrupar_por_recurso and apontamento.recurso_id is not None:
-                        key_parts.append(f"recurso_{apontamento.recurso_id}")
-                    
-                    if agrupar_por_projeto and apontamento.projeto_id is not None:
-                        key_parts.append(f"projeto_{apontamento.projeto_id}")
-                    
-                    if agrupar_por_data and apontamento.data_apontamento is not None:
-                        key_parts.append(f"data_{apontamento.data_apontamento.isoformat()}")
-                    
-                    if agrupar_por_mes and not agrupar_por_data and apontamento.data_apontamento is not None:
-                        key_parts.append(f"ano_mes_{apontamento.data_apontamento.year}_{apontamento.data_apontamento.month}")
-                    
-                    # Se não há chave de agrupamento, usar "todos"
-                    if not key_parts:
-                        key = "todos"
-                    else:
-                        key = "_".join(key_parts)
-                    
-                    # Inicializar grupo se não existir
-                    if key not in grupos:
-                        grupo = {
-                            "horas": 0,
-                            "quantidade": 0
-                        }
-                        
-                        # Adicionar informações de agrupamento
-                        if agrupar_por_recurso and apontamento.recurso_id is not None:
-                            grupo["recurso_id"] = apontamento.recurso_id
-                            # Tentar obter o nome do recurso se disponível
-                            if hasattr(apontamento, "recurso") and apontamento.recurso is not None:
-                                grupo["recurso_nome"] = apontamento.recurso.nome
-                        
-                        if agrupar_por_projeto and apontamento.projeto_id is not None:
-                            grupo["projeto_id"] = apontamento.projeto_id
-                            # Tentar obter o nome do projeto se disponível
-                            if hasattr(apontamento, "projeto") and apontamento.projeto is not None:
-                                grupo["projeto_nome"] = apontamento.projeto.nome
-                        
-                        if agrupar_por_data and apontamento.data_apontamento is not None:
-                            grupo["data"] = apontamento.data_apontamento.isoformat()
-                        
-                        if agrupar_por_mes and not agrupar_por_data and apontamento.data_apontamento is not None:
-                            grupo["ano"] = apontamento.data_apontamento.year
-                            grupo["mes"] = apontamento.data_apontamento.month
-                        
-                        grupos[key] = grupo
-                    
-                    # Atualizar horas e quantidade
-                    if apontamento.horas_apontadas is not None:
-                        grupos[key]["horas"] += float(apontamento.horas_apontadas)
-                    grupos[key]["quantidade"] += 1
-                    
-                except Exception as e:
-                    # Log do erro e continua
-                    print(f"Erro ao processar apontamento {apontamento.id if hasattr(apontamento, 'id') else 'desconhecido'}: {str(e)}")
-                    continue
+            query = query.with_only_columns(
+                func.coalesce(func.sum(self.model.horas_apontadas), 0).label("horas"),
+                func.count(self.model.id).label("quantidade"),
+                *colunas_grupo,
+            ).group_by(*colunas_grupo)
             
-            # Converter grupos para lista
-            for grupo in grupos.values():
-                resultado_agrupado.append(grupo)
+            result = await self.db.execute(query)
+            resultado_agrupado = [dict(row._mapping) for row in result]
+            for grupo in resultado_agrupado:
+                if "data" in grupo:
+                    grupo["data"] = grupo["data"].isoformat()
             
             # Ordenar resultado
             if agrupar_por_recurso:
@@ -448,6 +441,6 @@ class ApontamentoRepository(BaseRepository[Apontamento]):
             
         except Exception as e:
             # Log do erro e lança exceção HTTP 500
-            print(f"Erro ao processar relatório de horas apontadas: {str(e)}")
+            logger.exception("Erro ao processar relatório de horas apontadas")
             from fastapi import HTTPException
             raise HTTPException(status_code=500, detail=f"Erro ao processar relatório de horas apontadas: {str(e)}")
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
 from app.db.orm_models import Equipe
+from app.utils.search_utils import contains_pattern
 from app.repositories.base_repository import BaseRepository
 
 class EquipeRepository(BaseRepository[Equipe]):
@@ -26,7 +27,7 @@ class EquipeRepository(BaseRepository[Equipe]):
         query = self.db.query(Equipe)
         
         if nome:
-            query = query.filter(Equipe.nome.ilike(f"%{nome}%"))
+            query = query.filter(Equipe.nome.ilike(contains_pattern(nome), escape="/"))
         
         if secao_id:
             query = query.filter(Equipe.secao_id == secao_id)
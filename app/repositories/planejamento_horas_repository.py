@@ -48,7 +48,6 @@ class PlanejamentoHorasRepository(BaseRepository):
                     horas_planejadas=horas_planejadas
                 )
                 self.db.add(new_obj)
-                await self.db.flush()
                 await self.db.commit()
                 await self.db.refresh(new_obj)
                 logger.info(f"Novo planejamento ID={new_obj.id} criado com sucesso.")
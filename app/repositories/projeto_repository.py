@@ -1,8 +1,9 @@
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, or_, select, lambda_stmt
 
 from app.db.orm_models import Projeto, StatusProjeto
+from app.utils.search_utils import contains_pattern
 from app.repositories.base_repository import BaseRepository
 
 class ProjetoRepository(BaseRepository[Projeto]):
@@ -23,10 +24,35 @@ class ProjetoRepository(BaseRepository[Projeto]):
         Returns:
             Projeto encontrado ou None
         """
-        query = select(self.model).where(self.model.jira_project_key == jira_project_key)
+        # lambda_stmt: chamado por issue/worklog na sincronização; o SQL compilado fica em cache
+        query = lambda_stmt(lambda: select(Projeto).where(Projeto.jira_project_key == jira_project_key))
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    async def get_many_by_jira_project_keys(self, jira_project_keys: List[str]) -> Dict[str, Projeto]:
+        """
+        Busca em uma única consulta os projetos de várias chaves do Jira.
+
+        Args:
+            jira_project_keys: Chaves dos projetos no Jira
+
+        Returns:
+            Dicionário chave -> projeto (chaves sem projeto ficam de fora)
+        """
+        if not jira_project_keys:
+            return {}
+        query = (
+            select(self.model)
+            .where(self.model.jira_project_key.in_(set(jira_project_keys)))
+            .order_by(self.model.id)
+        )
+        result = await self.db.execute(query)
+        projetos: Dict[str, Projeto] = {}
+        for projeto in result.scalars():
+            # A chave não é única no banco; mantém o projeto mais antigo
+            projetos.setdefault(projeto.jira_project_key, projeto)
+        return projetos
+
     async def get_by_name(self, nome: str) -> Optional[Projeto]:
         """
         Busca um projeto pelo nome exato.
@@ -37,7 +63,7 @@ class ProjetoRepository(BaseRepository[Projeto]):
         Returns:
             Projeto encontrado ou None
         """
-        query = select(self.model).where(self.model.nome == nome)
+        query = lambda_stmt(lambda: select(Projeto).where(Projeto.nome == nome))
         result = await self.db.execute(query)
         return result.scalars().first()
         
@@ -137,9 +163,9 @@ class ProjetoRepository(BaseRepository[Projeto]):
         )
 
         if nome:
-            query = query.filter(self.model.nome.ilike(f"%{nome}%"))
+            query = query.filter(self.model.nome.ilike(contains_pattern(nome), escape="/"))
         if codigo_empresa:
-            query = query.filter(self.model.codigo_empresa.ilike(f"%{codigo_empresa}%"))
+            query = query.filter(self.model.codigo_empresa.ilike(contains_pattern(codigo_empresa), escape="/"))
         if status_projeto_id:
             query = query.filter(self.model.status_projeto_id == status_projeto_id)
         if ativo is not None:
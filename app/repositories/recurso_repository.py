@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, or_, func, select
 
 from app.db.orm_models import Recurso, Equipe, Secao
+from app.utils.search_utils import contains_pattern
 from app.repositories.base_repository import BaseRepository
 
 class RecursoRepository(BaseRepository[Recurso]):
@@ -23,6 +24,22 @@ class RecursoRepository(BaseRepository[Recurso]):
         """
         super().__init__(db, Recurso)
     
+    async def get_existing_ids(self, recurso_ids: List[int]) -> set:
+        """
+        Retorna quais dos IDs informados existem, em uma única consulta (IN).
+        
+        Args:
+            recurso_ids: IDs de recursos a verificar
+            
+        Returns:
+            Conjunto com os IDs encontrados
+        """
+        if not recurso_ids:
+            return set()
+        query = select(self.model.id).where(self.model.id.in_(set(recurso_ids)))
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+    
     async def get_by_jira_account_id(self, account_id: str) -> Optional[Recurso]:
         """
         Busca um recurso pelo ID da conta no Jira.
@@ -115,7 +132,7 @@ class RecursoRepository(BaseRepository[Recurso]):
         query = self.db.query(self.model)
         
         if nome:
-            query = query.filter(self.model.nome.ilike(f"%{nome}%"))
+            query = query.filter(self.model.nome.ilike(contains_pattern(nome), escape="/"))
             
         if equipe_id:
             query = query.filter(self.model.equipe_id == equipe_id)
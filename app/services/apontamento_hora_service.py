@@ -269,9 +269,8 @@ class ApontamentoHoraService:
                 logger.error(f"[PROCESSAR_WORKLOG] Erro ao processar data do worklog: {str(e)}")
                 return
                 
-            # Converter segundos para horas (decimal)
-            from decimal import Decimal
-            horas_apontadas = Decimal(time_spent_seconds) / Decimal(3600)
+            # Converter segundos para horas (float com 2 casas, mesma escala da coluna NUMERIC(5,2))
+            horas_apontadas = round(time_spent_seconds / 3600, 2)
             
             # Preparar dados do apontamento
             now = datetime.now()
@@ -1,8 +1,6 @@
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date
 from sqlalchemy import select, func, case, and_, or_, cast, String, Integer, extract, literal, literal_column, union_all, Float, Date
-# Alterando a importação para o local correto
-from app.db.orm_models import DimTempo
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.orm_models import (
@@ -609,61 +607,31 @@ class RelatorioService:
         start_date = date(start_year, start_month, 1)
         end_date = date(end_year, end_month, 1)
 
-        # Subquery para buscar as horas disponíveis na tabela de RH
+        # Horas disponíveis do recurso no intervalo (ano*100+mes permite comparar o par ano/mês
+        # direto nas colunas, sem montar uma data por linha)
+        ano_mes = HorasDisponiveisRH.ano * 100 + HorasDisponiveisRH.mes
         rh_query = (
             select(
-                HorasDisponiveisRH.mes,
                 HorasDisponiveisRH.ano,
-                HorasDisponiveisRH.horas_disponiveis_mes
+                HorasDisponiveisRH.mes,
+                func.max(HorasDisponiveisRH.horas_disponiveis_mes).label("horas_disponiveis")
             )
             .where(HorasDisponiveisRH.recurso_id == request.recurso_id)
-            .where(
-                func.to_date(HorasDisponiveisRH.ano.cast(String) + '-' + HorasDisponiveisRH.mes.cast(String), 'YYYY-MM')
-                .between(start_date, end_date)
-            )
-            .alias("rh_query")
+            .where(ano_mes.between(start_year * 100 + start_month, end_year * 100 + end_month))
+            .group_by(HorasDisponiveisRH.ano, HorasDisponiveisRH.mes)
         )
-
-        # Query principal para buscar os meses do período na dim_tempo
-        # e juntar com as horas disponíveis
-        # Constrói expressão 'YYYY-MM' a partir de ano e mês
-        mes_ano_expr = func.concat(
-            DimTempo.ano.cast(String),
-            '-',
-            func.lpad(DimTempo.mes.cast(String), 2, '0')
-        ).label('mes_ano_str')
-
-        main_query = (
-            select(
-                mes_ano_expr,
-                func.coalesce(func.max(rh_query.c.horas_disponiveis_mes), 0).label("horas_disponiveis"),
-                DimTempo.ano,
-                DimTempo.mes
+        result = await self.db.execute(rh_query)
+        horas_por_ano_mes = {(row.ano, row.mes): row.horas_disponiveis for row in result}
+
+        # Os meses do período são gerados aqui mesmo; antes vinham de um JOIN com a
+        # dim_tempo (uma linha por dia) só para enumerar os meses
+        meses_horas = []
+        ano, mes = start_date.year, start_date.month
+        while (ano, mes) <= (end_date.year, end_date.month):
+            meses_horas.append(
+                MesHoras(mes=f"{ano}-{mes:02d}", horas=horas_por_ano_mes.get((ano, mes)) or 0)
             )
-            .select_from(DimTempo)
-            .outerjoin(
-                rh_query, 
-                and_(
-                    DimTempo.mes == rh_query.c.mes,
-                    DimTempo.ano == rh_query.c.ano
-                )
-            )
-            .where(
-                func.to_date(mes_ano_expr, 'YYYY-MM')
-                .between(start_date, end_date)
-            )
-            .distinct()
-            .group_by(mes_ano_expr, DimTempo.ano, DimTempo.mes)
-            .order_by(DimTempo.ano, DimTempo.mes)
-        )
-
-        result = await self.db.execute(main_query)
-        rows = result.fetchall()
-
-        meses_horas = [
-            MesHoras(mes=row.mes_ano_str, horas=row.horas_disponiveis)
-            for row in rows
-        ]
+            ano, mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
 
         periodo_dict = {"data_inicio": start_str, "data_fim": end_str}
 
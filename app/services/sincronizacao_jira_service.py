@@ -26,6 +26,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from dateutil import parser
+from sqlalchemy import inspect as sa_inspect
 
 from app.db.session import AsyncSessionLocal
 from app.integrations.jira_client import JiraClient
@@ -70,6 +71,9 @@ class SincronizacaoJiraFuncional:
         self.secao_repo = SecaoRepository(session)
         self.projeto_repo = ProjetoRepository(session)
         self.recurso_repo = RecursoRepository(session)
+
+        # Projetos por chave Jira, pré-carregados em lote por processar_periodo
+        self._projetos_por_chave: Dict[str, Any] = {}
         
         # Contadores para relatório
         self.stats = {
@@ -205,6 +209,21 @@ class SincronizacaoJiraFuncional:
             logger.error(f"[RECURSO_ERROR] Erro ao processar recurso: {str(e)}")
             return None
 
+    async def _projeto_por_chave(self, jira_key: str) -> Optional[Any]:
+        """Projeto da chave Jira, consultando o banco só se não estiver no lote pré-carregado."""
+        projeto = self._projetos_por_chave.get(jira_key)
+        if projeto is not None:
+            # Após um rollback os objetos da sessão expiram (ou somem, se criados na transação);
+            # nesse caso relê do banco em vez de disparar lazy load fora do greenlet
+            estado = sa_inspect(projeto)
+            if not estado.persistent or estado.expired_attributes:
+                projeto = None
+        if projeto is None:
+            projeto = await self.projeto_repo.get_by_jira_project_key(jira_key)
+            if projeto is not None:
+                self._projetos_por_chave[jira_key] = projeto
+        return projeto
+
     async def upsert_projeto(self, issue_key: str, issue_summary: str, secao_id: int, fields: Dict[str, Any] = None) -> Optional[Any]:
         """
         Busca ou cria um projeto baseado na issue do Jira com campos adicionais.
@@ -220,7 +239,7 @@ class SincronizacaoJiraFuncional:
         """
         try:
             # Buscar projeto existente
-            projeto = await self.projeto_repo.get_by_jira_project_key(issue_key)
+            projeto = await self._projeto_por_chave(issue_key)
             
             if projeto:
                 # Atualizar nome se mudou
@@ -289,6 +308,7 @@ class SincronizacaoJiraFuncional:
             }
             
             projeto = await self.projeto_repo.create(projeto_data)
+            self._projetos_por_chave[issue_key] = projeto
             self.stats['projetos_criados'] += 1
             logger.info(f"[PROJETO_CREATED] Novo projeto criado: {projeto.nome} (id={projeto.id})")
             
@@ -341,6 +361,16 @@ class SincronizacaoJiraFuncional:
                     projetos_encontrados[project_key] = projetos_encontrados.get(project_key, 0) + 1
                 
                 logger.info(f"[PROJETOS_ENCONTRADOS] {projetos_encontrados}")
+
+                # Uma consulta para os projetos (e projetos pai) de todas as issues do período,
+                # em vez de uma por issue e outra por worklog com parent
+                chaves = {issue["key"] for issue in issues if issue.get("key")}
+                chaves.update(
+                    issue["fields"]["parent"]["key"]
+                    for issue in issues
+                    if ((issue.get("fields") or {}).get("parent") or {}).get("key")
+                )
+                self._projetos_por_chave = await self.projeto_repo.get_many_by_jira_project_keys(list(chaves))
                 
             except Exception as e:
                 logger.error(f"[BUSCA_ISSUES_ERRO] Erro ao buscar issues: {str(e)}")
@@ -435,16 +465,22 @@ class SincronizacaoJiraFuncional:
         worklogs = self.jira_client.get_all_worklogs(issue_key)
         logger.info(f"[WORKLOGS] Issue {issue_key}: {len(worklogs)} worklogs")
         
+        apontamentos = []
         for worklog in worklogs:
             try:
-                await self._processar_worklog(worklog, issue_key, recurso.id, projeto.id, data_inicio, data_fim, fields)
+                apontamento_data = await self._processar_worklog(worklog, issue_key, recurso.id, projeto.id, data_inicio, data_fim, fields)
+                if apontamento_data:
+                    apontamentos.append(apontamento_data)
             except Exception as e:
                 wl_id = worklog.get("id", "NO_ID")
                 logger.error(f"[WORKLOG_ERROR] Erro no worklog {wl_id}: {str(e)}")
                 continue
+        
+        # Grava todos os worklogs da issue de uma vez (um upsert em lote, um commit)
+        self.stats['apontamentos_criados'] += await self.apontamento_repo.sync_jira_apontamentos(apontamentos)
 
-    async def _processar_worklog(self, worklog: Dict[str, Any], issue_key: str, recurso_id: int, projeto_id: int, data_inicio: datetime, data_fim: datetime, fields: Dict[str, Any] = None):
-        """Processa um worklog individual"""
+    async def _processar_worklog(self, worklog: Dict[str, Any], issue_key: str, recurso_id: int, projeto_id: int, data_inicio: datetime, data_fim: datetime, fields: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Monta os dados do apontamento de um worklog (None se o worklog deve ser ignorado)"""
         wl_id_str = worklog.get("id")
         if not wl_id_str:
             logger.warning(f"[WORKLOG_SKIP] Worklog sem ID para {issue_key}")
@@ -496,7 +532,7 @@ class SincronizacaoJiraFuncional:
                 # Buscar ou criar projeto pai se existir
                 if jira_parent_key:
                     try:
-                        projeto_pai = await self.projeto_repo.get_by_jira_project_key(jira_parent_key)
+                        projeto_pai = await self._projeto_por_chave(jira_parent_key)
                         
                         if not projeto_pai:
                             # Projeto pai não existe, vamos buscar no Jira e criar
@@ -531,6 +567,7 @@ class SincronizacaoJiraFuncional:
         
         # Dados do apontamento
         apontamento_data = {
+            "jira_worklog_id": wl_id_str,
             "recurso_id": recurso_id,
             "projeto_id": projeto_id,
             "jira_issue_key": issue_key,
@@ -550,10 +587,10 @@ class SincronizacaoJiraFuncional:
             "nome_projeto_pai": nome_projeto_pai,
         }
         
-        # Criar/atualizar apontamento
-        await self.apontamento_repo.sync_jira_apontamento(wl_id_str, apontamento_data)
-        self.stats['apontamentos_criados'] += 1
-        logger.debug(f"[APONTAMENTO] Criado para worklog {wl_id_str}: {horas}h")
+        # Normaliza e valida aqui, dentro do try do worklog: um worklog inválido não derruba o lote da issue
+        self.apontamento_repo.preparar_dados_jira(apontamento_data, "APONTAMENTO")
+        logger.debug(f"[APONTAMENTO] Preparado para worklog {wl_id_str}: {horas}h")
+        return apontamento_data
 
     async def _buscar_todas_issues_paginacao(self, jql_query: str, fields: list = None):
         """Busca issues com paginação (copiado do melhorada.py)"""
@@ -0,0 +1,48 @@
+# app/utils/cache.py
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class TTLCache:
+    """
+    Cache em memória com expiração por tempo, para dados de referência que quase
+    nunca mudam (ex.: status de projeto).
+
+    O cache é por processo: com vários workers, uma alteração só invalida o cache
+    do worker que a executou e os demais enxergam o novo valor após o TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, maxsize: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor da chave ou None se ausente/expirado."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expira_em, valor = item
+        if expira_em < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return valor
+
+    def set(self, key: Hashable, valor: Any) -> None:
+        if self.maxsize is not None and key not in self._data and len(self._data) >= self.maxsize:
+            # Descarta a entrada mais antiga (dicts preservam a ordem de inserção)
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl_seconds, valor)
+
+    def clear(self) -> None:
+        """Invalida todas as entradas (usar após create/update/delete)."""
+        self._data.clear()
+
+    def clear_on_commit(self, session: AsyncSession) -> None:
+        """
+        Invalida o cache quando a transação da sessão for confirmada. Limpar antes do commit
+        deixaria um leitor concorrente repovoar o cache com a linha anterior à escrita.
+        """
+        event.listen(session.sync_session, "after_commit", lambda _session: self.clear(), once=True)
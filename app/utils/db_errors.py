@@ -0,0 +1,37 @@
+# app/utils/db_errors.py
+
+from typing import Optional
+from sqlalchemy.exc import DBAPIError
+
+# SQLSTATE do PostgreSQL para violação de UNIQUE
+UNIQUE_VIOLATION = "23505"
+
+# Mensagem de negócio por constraint única; montado uma vez no import.
+MENSAGENS_UNIQUE = {
+    "uq_alocacao_recurso_projeto_data": "Já existe outra alocação para este recurso neste projeto com a mesma data de início.",
+    "uq_horas_planejadas_alocacao_ano_mes": "Já existe um planejamento para esta alocação, ano e mês",
+    "uq_horas_disponveis_recurso_ano_mes": "Já existem horas disponíveis cadastradas para este recurso, ano e mês",
+    "uq_equipe_secao_nome": "Já existe uma equipe com este nome nesta seção",
+    "ix_projeto_codigo_empresa": "Já existe um projeto com este código de empresa",
+}
+
+
+def sqlstate(exc: DBAPIError) -> Optional[str]:
+    """SQLSTATE do erro do driver, sem formatar a mensagem (str(e) inclui SQL e parâmetros)."""
+    return getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+
+
+def constraint_name(exc: DBAPIError) -> Optional[str]:
+    """Nome da constraint violada (o asyncpg o expõe na exceção original encadeada)."""
+    orig = exc.orig
+    return getattr(orig, "constraint_name", None) or getattr(orig.__cause__, "constraint_name", None)
+
+
+def unique_violation_detail(exc: DBAPIError) -> Optional[str]:
+    """
+    Retorna a mensagem de negócio se o erro for violação de UNIQUE, ou None caso contrário.
+    Constraints sem mensagem cadastrada recebem uma mensagem genérica.
+    """
+    if sqlstate(exc) != UNIQUE_VIOLATION:
+        return None
+    return MENSAGENS_UNIQUE.get(constraint_name(exc), "Registro duplicado")
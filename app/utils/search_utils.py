@@ -14,6 +14,15 @@ def apply_search_filter(query: Query, model, search: str, fields=None):
     """
     if not search or not fields:
         return query
-    search = search.strip().lower()
-    filters = [func.lower(getattr(model, field.key)).like(f"%{search}%") for field in fields]
+    pattern = contains_pattern(search.strip().lower())
+    filters = [func.lower(getattr(model, field.key)).like(pattern, escape="/") for field in fields]
     return query.filter(or_(*filters))
+
+def contains_pattern(search: str) -> str:
+    """
+    Monta o padrão '%termo%' no cliente, escapando os curingas digitados pelo usuário.
+    Usar com .ilike(padrao, escape="/") (mesmo caractere do autoescape do SQLAlchemy):
+    vai ao banco como um único parâmetro, que o índice trigram (gin_trgm_ops) consegue usar.
+    """
+    escaped = search.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
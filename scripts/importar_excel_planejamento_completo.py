@@ -61,7 +61,7 @@ class ImportadorExcelPlanejamento:
             database_url = f"postgresql://{settings.DB_USER}:{password}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
             
             engine = create_engine(database_url)
-            Session = sessionmaker(bind=engine)
+            Session = sessionmaker(bind=engine, expire_on_commit=False)
             self.session = Session()
             logger.info("Conectado ao banco de dados")
         except Exception as e:
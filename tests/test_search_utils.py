@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import create_engine, literal, select
+
+from app.utils.search_utils import contains_pattern
+
+
+@pytest.mark.parametrize(
+    "termo, esperado",
+    [
+        ("abc", "%abc%"),
+        ("50%", "%50/%%"),
+        ("dev_01", "%dev/_01%"),
+        ("a/b", "%a//b%"),
+        ("/%_", "%///%/_%"),
+    ],
+)
+def test_contains_pattern_escapa_curingas(termo, esperado):
+    assert contains_pattern(termo) == esperado
+
+
+@pytest.mark.parametrize(
+    "valor, termo, casa",
+    [
+        ("Projeto 50% concluído", "50%", True),
+        ("Projeto 500 concluído", "50%", False),
+        ("dev_01", "dev_01", True),
+        ("devX01", "dev_01", False),
+        ("TI/Infra", "i/in", True),
+        ("TIInfra", "i/in", False),
+    ],
+)
+def test_contains_pattern_casa_literalmente(valor, termo, casa):
+    # O banco aplica o mesmo ESCAPE '/' usado pelos repositórios
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        resultado = conn.execute(
+            select(literal(valor).ilike(contains_pattern(termo), escape="/"))
+        ).scalar_one()
+    assert bool(resultado) is casa